@@ -22,6 +22,7 @@ Autor: Estudiante
 Actividad: Práctica II - Sistemas de Información
 """
 
+import logging
 import sys
 import os
 from pathlib import Path
@@ -39,6 +40,60 @@ from axanet.excepciones import (
 )
 
 
+def _imprimir_pantalla(lineas):
+    """
+    Escribe todas las líneas de una pantalla con una sola llamada.
+    
+    Cada print() es una escritura a la terminal; juntar la pantalla
+    completa en un solo texto reduce esas escrituras a una.
+    
+    Args:
+        lineas: Lista de líneas a mostrar
+    """
+    sys.stdout.write("\n".join(lineas) + "\n")
+
+
+def _mostrar_mensajes_gestor():
+    """
+    Muestra en pantalla los mensajes de seguimiento del gestor de clientes.
+    
+    El gestor los emite con logging en nivel DEBUG (silenciosos por defecto);
+    esta aplicación es didáctica y sí quiere enseñarlos, tal como se
+    escriben, junto con el resto de la salida.
+    """
+    registro = logging.getLogger("axanet.cliente_manager")
+    if registro.handlers:
+        return
+    manejador = logging.StreamHandler(sys.stdout)
+    manejador.setFormatter(logging.Formatter("%(message)s"))
+    registro.addHandler(manejador)
+    registro.setLevel(logging.DEBUG)
+    registro.propagate = False
+
+
+# Formato de cada fila del listado de clientes (#, nombre, teléfono, servicios)
+_FORMATO_FILA_CLIENTE = "{:<3} {:<25} {:<12} {:<10}".format
+
+# Respuestas aceptadas como confirmación (comparadas en minúsculas): solo
+# lo que pide el mensaje, con o sin acento, porque la acción es irreversible
+_RESPUESTAS_AFIRMATIVAS = frozenset({"si", "sí"})
+
+# El menú nunca cambia, así que su texto se arma una sola vez
+_TEXTO_MENU = "\n".join([
+    "\n📋 MENÚ PRINCIPAL",
+    "─" * 35,
+    "1. 📝 Crear nuevo cliente",
+    "2. 🔍 Buscar cliente por nombre",
+    "3. 📊 Ver todos los clientes",
+    "4. ➕ Agregar servicio a cliente",
+    "5. 🗑️  Eliminar cliente",
+    "6. 📈 Ver estadísticas del sistema",
+    "7. 🎓 Demostrar tabla hash",
+    "0. 🚪 Salir del programa",
+    "─" * 35,
+]) + "\n"
+
+
 class AplicacionAxanet:
     """
     Clase principal de la aplicación Axanet.
@@ -54,48 +109,84 @@ class AplicacionAxanet:
         El gestor contiene la tabla hash (diccionario) principal.
         """
         print("🔄 Inicializando sistema Axanet...")
+        _mostrar_mensajes_gestor()
         self.gestor_clientes = ClienteManager()
+        
+        # Tabla de despacho del menú, construida una sola vez: cada opción
+        # se resuelve con una búsqueda en el diccionario en lugar de
+        # recorrer una cadena de if/elif
+        self._acciones_menu = {
+            "1": self.crear_cliente,
+            "2": self.buscar_cliente,
+            "3": self.listar_todos_clientes,
+            "4": self.agregar_servicio,
+            "5": self.eliminar_cliente,
+            "6": self.mostrar_estadisticas,
+            "7": self.demostrar_tabla_hash,
+        }
         print("✅ Sistema listo para usar")
         
+    def _leer_entrada(self, mensaje: str) -> str:
+        """
+        Lee una respuesta del usuario.
+        
+        En una terminal se usa input() normalmente. Si la entrada viene de un
+        archivo o tubería se lee una línea por respuesta con readline(): un
+        programa que conversa con el menú por una tubería (o `yes |`) recibe
+        cada pregunta sin que haya que esperar al fin de la entrada.
+        
+        Args:
+            mensaje: Texto que se muestra antes de leer
+            
+        Returns:
+            Línea ingresada (sin el salto de línea)
+            
+        Raises:
+            EOFError: Si ya no quedan líneas en la entrada redirigida
+        """
+        if sys.stdin.isatty():
+            return input(mensaje)
+        
+        # La pregunta debe llegar antes de bloquear esperando la respuesta
+        sys.stdout.write(mensaje)
+        sys.stdout.flush()
+        linea = sys.stdin.readline()
+        if not linea:
+            raise EOFError
+        return linea[:-1] if linea.endswith("\n") else linea
+
     def mostrar_bienvenida(self):
         """Muestra el mensaje de bienvenida y información del sistema."""
-        print("\n" + "="*55)
-        print("🏢 SISTEMA DE GESTIÓN DE CLIENTES AXANET")
-        print("   Utilizando Tablas Hash para Búsquedas Rápidas")
-        print("="*55)
-        print("📚 CONCEPTOS DEMOSTRADOS:")
-        print("   • Tablas Hash (Diccionarios) - Búsqueda O(1)")
-        print("   • Gestión de Archivos de Texto")
-        print("   • Validación de Datos")
-        print("   • Manejo de Errores")
-        print("   • Programación Modular")
+        lineas = [
+            "\n" + "="*55,
+            "🏢 SISTEMA DE GESTIÓN DE CLIENTES AXANET",
+            "   Utilizando Tablas Hash para Búsquedas Rápidas",
+            "="*55,
+            "📚 CONCEPTOS DEMOSTRADOS:",
+            "   • Tablas Hash (Diccionarios) - Búsqueda O(1)",
+            "   • Gestión de Archivos de Texto",
+            "   • Validación de Datos",
+            "   • Manejo de Errores",
+            "   • Programación Modular",
+        ]
         
-        # Mostrar estadísticas actuales si hay clientes
+        # Mostrar el número de clientes sin cargar sus archivos; las
+        # estadísticas completas están en la opción 6 del menú
         try:
-            estadisticas = self.gestor_clientes.obtener_estadisticas()
-            if estadisticas["total_clientes"] > 0:
-                print(f"\n📊 ESTADO ACTUAL:")
-                print(f"   • Clientes registrados: {estadisticas['total_clientes']}")
-                print(f"   • Servicios en total: {estadisticas['total_servicios']}")
-                print(f"   • Promedio servicios por cliente: {estadisticas['promedio_servicios']:.1f}")
+            total_clientes = self.gestor_clientes.contar_clientes()
+            if total_clientes > 0:
+                lineas.append(f"\n📊 ESTADO ACTUAL:")
+                lineas.append(f"   • Clientes registrados: {total_clientes}")
+                lineas.append(f"   • Estadísticas completas: opción 6 del menú")
         except Exception:
-            print("\n📊 ESTADO: Sistema vacío - ¡Crea tu primer cliente!")
+            lineas.append("\n📊 ESTADO: Sistema vacío - ¡Crea tu primer cliente!")
             
-        print("="*55)
+        lineas.append("="*55)
+        _imprimir_pantalla(lineas)
 
     def mostrar_menu(self):
         """Muestra las opciones disponibles en el menú principal."""
-        print("\n📋 MENÚ PRINCIPAL")
-        print("─" * 35)
-        print("1. 📝 Crear nuevo cliente")
-        print("2. 🔍 Buscar cliente por nombre") 
-        print("3. 📊 Ver todos los clientes")
-        print("4. ➕ Agregar servicio a cliente")
-        print("5. 🗑️  Eliminar cliente")
-        print("6. 📈 Ver estadísticas del sistema")
-        print("7. 🎓 Demostrar tabla hash")
-        print("0. 🚪 Salir del programa")
-        print("─" * 35)
+        sys.stdout.write(_TEXTO_MENU)
 
     def crear_cliente(self):
         """
@@ -111,22 +202,22 @@ class AplicacionAxanet:
         
         try:
             # Solicitar datos del cliente
-            nombre = input("👤 Nombre completo del cliente: ").strip()
+            nombre = self._leer_entrada("👤 Nombre completo del cliente: ").strip()
             if not nombre:
                 print("❌ El nombre no puede estar vacío")
                 return
                 
-            telefono = input("📞 Teléfono (10 dígitos): ").strip()
+            telefono = self._leer_entrada("📞 Teléfono (10 dígitos): ").strip()
             if not telefono:
                 print("❌ El teléfono no puede estar vacío")
                 return
                 
-            email = input("📧 Correo electrónico: ").strip()
+            email = self._leer_entrada("📧 Correo electrónico: ").strip()
             if not email:
                 print("❌ El correo no puede estar vacío")
                 return
                 
-            primer_servicio = input("🔧 Descripción del primer servicio: ").strip()
+            primer_servicio = self._leer_entrada("🔧 Descripción del primer servicio: ").strip()
             if not primer_servicio:
                 print("❌ Debe proporcionar una descripción del servicio")
                 return
@@ -163,7 +254,7 @@ class AplicacionAxanet:
         print("\n🔍 BUSCAR CLIENTE")
         print("─" * 17)
         
-        nombre = input("👤 Ingrese el nombre del cliente: ").strip()
+        nombre = self._leer_entrada("👤 Ingrese el nombre del cliente: ").strip()
         if not nombre:
             print("❌ Debe ingresar un nombre")
             return
@@ -172,23 +263,33 @@ class AplicacionAxanet:
             print("⏳ Buscando en tabla hash...")
             
             # Esta búsqueda es O(1) gracias a la tabla hash
-            cliente = self.gestor_clientes.obtener_cliente(nombre)
+            clave = ClienteManager.normalizar_nombre(nombre)
+            cliente = self.gestor_clientes.obtener_cliente(clave, ya_normalizado=True)
             
-            print("✅ Cliente encontrado:")
-            print("─" * 25)
-            print(f"👤 Nombre: {cliente.nombre}")
-            print(f"🆔 ID: {cliente.id_cliente}")
-            print(f"📞 Teléfono: {cliente.telefono}")
-            print(f"📧 Email: {cliente.email}")
-            print(f"📅 Registrado: {cliente.fecha_registro}")
-            print(f"\n🔧 SERVICIOS ({len(cliente.servicios)}):")
+            lineas = [
+                "✅ Cliente encontrado:",
+                "─" * 25,
+                f"👤 Nombre: {cliente.nombre}",
+                f"🆔 ID: {cliente.id_cliente}",
+                f"📞 Teléfono: {cliente.telefono}",
+                f"📧 Email: {cliente.email}",
+                f"📅 Registrado: {cliente.fecha_registro}",
+                f"\n🔧 SERVICIOS ({len(cliente.servicios)}):",
+            ]
             
             for i, servicio in enumerate(cliente.servicios, 1):
-                print(f"   {i}. {servicio.descripcion}")
-                print(f"      📅 Fecha: {servicio.fecha_solicitud}")
+                lineas.append(f"   {i}. {servicio.descripcion}")
+                lineas.append(f"      📅 Fecha: {servicio.fecha_solicitud}")
+            
+            _imprimir_pantalla(lineas)
                 
         except ClienteNoEncontradoError:
             print(f"❌ No se encontró un cliente con el nombre '{nombre}'")
+            
+            # Ofrecer nombres que empiezan igual (búsqueda en el árbol de prefijos)
+            sugerencias = self.gestor_clientes.sugerir_nombres(clave, ya_normalizado=True)
+            if sugerencias:
+                print(f"🤔 ¿Quiso decir?: {', '.join(sugerencias)}")
             print("💡 Verifique la ortografía o use la opción 3 para ver todos los clientes")
         except Exception as e:
             print(f"❌ Error al buscar: {e}")
@@ -214,18 +315,24 @@ class AplicacionAxanet:
                 print("💡 Use la opción 1 para crear el primer cliente")
                 return
             
-            print(f"✅ Se encontraron {len(clientes)} cliente(s):\n")
+            lineas = [
+                f"✅ Se encontraron {len(clientes)} cliente(s):\n",
+                # Mostrar tabla de clientes
+                f"{'#':<3} {'NOMBRE':<25} {'TELÉFONO':<12} {'SERVICIOS':<10}",
+                "─" * 55,
+            ]
             
-            # Mostrar tabla de clientes
-            print(f"{'#':<3} {'NOMBRE':<25} {'TELÉFONO':<12} {'SERVICIOS':<10}")
-            print("─" * 55)
-            
-            for i, cliente in enumerate(clientes, 1):
-                nombre_corto = cliente.nombre[:22] + "..." if len(cliente.nombre) > 25 else cliente.nombre
-                print(f"{i:<3} {nombre_corto:<25} {cliente.telefono:<12} {len(cliente.servicios):<10}")
+            # Formato de fila ligado una sola vez a una variable local
+            fila = _FORMATO_FILA_CLIENTE
+            lineas.append("\n".join(
+                fila(i, cliente.nombre[:22] + "..." if len(cliente.nombre) > 25 else cliente.nombre,
+                     cliente.telefono, len(cliente.servicios))
+                for i, cliente in enumerate(clientes, 1)
+            ))
                 
-            print("─" * 55)
-            print(f"Total: {len(clientes)} cliente(s) en la tabla hash")
+            lineas.append("─" * 55)
+            lineas.append(f"Total: {len(clientes)} cliente(s) en la tabla hash")
+            _imprimir_pantalla(lineas)
             
         except Exception as e:
             print(f"❌ Error al listar clientes: {e}")
@@ -242,19 +349,22 @@ class AplicacionAxanet:
         print("\n➕ AGREGAR SERVICIO A CLIENTE")
         print("─" * 29)
         
-        nombre = input("👤 Nombre del cliente: ").strip()
+        nombre = self._leer_entrada("👤 Nombre del cliente: ").strip()
         if not nombre:
             print("❌ Debe ingresar un nombre")
             return
             
         try:
+            # Normalizar una sola vez y reutilizar la clave en ambas llamadas
+            clave = ClienteManager.normalizar_nombre(nombre)
+            
             # Primero verificar que el cliente existe (búsqueda O(1))
-            cliente = self.gestor_clientes.obtener_cliente(nombre)
+            cliente = self.gestor_clientes.obtener_cliente(clave, ya_normalizado=True)
             print(f"✅ Cliente encontrado: {cliente.nombre}")
             print(f"📋 Servicios actuales: {len(cliente.servicios)}")
             
             # Solicitar descripción del nuevo servicio
-            nuevo_servicio = input("🔧 Descripción del nuevo servicio: ").strip()
+            nuevo_servicio = self._leer_entrada("🔧 Descripción del nuevo servicio: ").strip()
             if not nuevo_servicio:
                 print("❌ La descripción del servicio no puede estar vacía")
                 return
@@ -262,7 +372,7 @@ class AplicacionAxanet:
             # Agregar el servicio
             print("⏳ Agregando servicio...")
             cliente_actualizado = self.gestor_clientes.agregar_servicio_cliente(
-                nombre, nuevo_servicio
+                clave, nuevo_servicio, ya_normalizado=True
             )
             
             print("✅ Servicio agregado exitosamente!")
@@ -285,14 +395,17 @@ class AplicacionAxanet:
         print("\n🗑️  ELIMINAR CLIENTE")
         print("─" * 18)
         
-        nombre = input("👤 Nombre del cliente a eliminar: ").strip()
+        nombre = self._leer_entrada("👤 Nombre del cliente a eliminar: ").strip()
         if not nombre:
             print("❌ Debe ingresar un nombre")
             return
             
         try:
+            # Normalizar una sola vez y reutilizar la clave en ambas llamadas
+            clave = ClienteManager.normalizar_nombre(nombre)
+            
             # Verificar que el cliente existe
-            cliente = self.gestor_clientes.obtener_cliente(nombre)
+            cliente = self.gestor_clientes.obtener_cliente(clave, ya_normalizado=True)
             
             # Mostrar información del cliente antes de eliminar
             print(f"\n⚠️  ATENCIÓN: Se eliminará el siguiente cliente:")
@@ -301,11 +414,11 @@ class AplicacionAxanet:
             print(f"🔧 Servicios: {len(cliente.servicios)}")
             
             # Pedir confirmación
-            confirmacion = input("\n❓ ¿Está seguro? (escriba 'SI' para confirmar): ").strip().upper()
+            confirmacion = self._leer_entrada("\n❓ ¿Está seguro? (escriba 'SI' para confirmar): ").strip().casefold()
             
-            if confirmacion == "SI":
+            if confirmacion in _RESPUESTAS_AFIRMATIVAS:
                 print("⏳ Eliminando cliente...")
-                exito = self.gestor_clientes.eliminar_cliente(nombre)
+                exito = self.gestor_clientes.eliminar_cliente(clave, ya_normalizado=True)
                 
                 if exito:
                     print("✅ Cliente eliminado exitosamente")
@@ -335,22 +448,28 @@ class AplicacionAxanet:
         
         try:
             estadisticas = self.gestor_clientes.obtener_estadisticas()
+            # Se lee una sola vez; las líneas de abajo reutilizan el valor
+            clientes_en_cache = len(self.gestor_clientes._cache_clientes)
             
-            print("📊 DATOS GENERALES:")
-            print(f"   • Total de clientes: {estadisticas['total_clientes']}")
-            print(f"   • Total de servicios: {estadisticas['total_servicios']}")
-            print(f"   • Promedio servicios/cliente: {estadisticas['promedio_servicios']:.2f}")
+            lineas = [
+                "📊 DATOS GENERALES:",
+                f"   • Total de clientes: {estadisticas['total_clientes']}",
+                f"   • Total de servicios: {estadisticas['total_servicios']}",
+                f"   • Promedio servicios/cliente: {estadisticas['promedio_servicios']:.2f}",
+            ]
             
             if estadisticas['total_clientes'] > 0:
-                print("\n💾 INFORMACIÓN DE ALMACENAMIENTO:")
-                print(f"   • Archivos en disco: {estadisticas['total_clientes']}")
-                print(f"   • Clientes en tabla hash: {len(self.gestor_clientes._cache_clientes)}")
-                print(f"   • Directorio: axanet_clients_data/")
+                lineas.append("\n💾 INFORMACIÓN DE ALMACENAMIENTO:")
+                lineas.append(f"   • Archivos en disco: {estadisticas['total_clientes']}")
+                lineas.append(f"   • Clientes en tabla hash: {clientes_en_cache}")
+                lineas.append(f"   • Directorio: axanet_clients_data/")
                 
-                print("\n⚡ RENDIMIENTO DE TABLA HASH:")
-                print(f"   • Tiempo de búsqueda: O(1) constante")
-                print(f"   • Colisiones: 0 (nombres únicos)")
-                print(f"   • Factor de carga: {len(self.gestor_clientes._cache_clientes)} elementos")
+                lineas.append("\n⚡ RENDIMIENTO DE TABLA HASH:")
+                lineas.append(f"   • Tiempo de búsqueda: O(1) constante")
+                lineas.append(f"   • Colisiones: 0 (nombres únicos)")
+                lineas.append(f"   • Factor de carga: {clientes_en_cache} elementos")
+            
+            _imprimir_pantalla(lineas)
                 
         except Exception as e:
             print(f"❌ Error al obtener estadísticas: {e}")
@@ -385,13 +504,17 @@ class AplicacionAxanet:
             print(f"   • Complejidad de búsqueda: O(1)")
             
             print(f"\n🗝️  CLAVES EN LA TABLA HASH:")
-            for i, (clave, cliente) in enumerate(cache.items(), 1):
-                print(f"   {i}. '{clave}' → {cliente.nombre}")
+            # Una sola escritura para todas las claves en lugar de un print por clave
+            sys.stdout.write("\n".join(
+                f"   {i}. '{clave}' → {cliente.nombre}"
+                for i, (clave, cliente) in enumerate(cache.items(), 1)
+            ) + "\n")
                 
             # Demostración de búsqueda
             print(f"\n🔍 DEMOSTRACIÓN DE BÚSQUEDA O(1):")
             if cache:
-                primera_clave = list(cache.keys())[0]
+                # next(iter()) toma la primera clave sin copiar todas a una lista
+                primera_clave = next(iter(cache))
                 print(f"   • Buscando clave: '{primera_clave}'")
                 print(f"   • Resultado: cache['{primera_clave}'] = {cache[primera_clave].nombre}")
                 print(f"   • Tiempo: O(1) - ¡Inmediato sin importar cuántos clientes hay!")
@@ -411,39 +534,35 @@ class AplicacionAxanet:
         """
         self.mostrar_bienvenida()
         
+        acciones = self._acciones_menu
+        
         while True:
             try:
                 self.mostrar_menu()
-                opcion = input("\n🎯 Seleccione una opción (0-7): ").strip()
+                opcion = self._leer_entrada("\n🎯 Seleccione una opción (0-7): ").strip()
                 
                 if opcion == "0":
                     print("\n👋 ¡Gracias por usar el Sistema Axanet!")
                     print("🎓 Esperamos que haya aprendido sobre tablas hash")
                     break
-                elif opcion == "1":
-                    self.crear_cliente()
-                elif opcion == "2":
-                    self.buscar_cliente()
-                elif opcion == "3":
-                    self.listar_todos_clientes()
-                elif opcion == "4":
-                    self.agregar_servicio()
-                elif opcion == "5":
-                    self.eliminar_cliente()
-                elif opcion == "6":
-                    self.mostrar_estadisticas()
-                elif opcion == "7":
-                    self.demostrar_tabla_hash()
-                else:
+                
+                accion = acciones.get(opcion)
+                if accion is None:
                     print("❌ Opción no válida. Por favor seleccione 0-7.")
+                else:
+                    accion()
                     
                 # Pausa para que el usuario pueda leer el resultado
                 if opcion != "0":
-                    input("\n⏸️  Presione Enter para continuar...")
+                    self._leer_entrada("\n⏸️  Presione Enter para continuar...")
                     
             except KeyboardInterrupt:
                 print("\n\n👋 Programa interrumpido por el usuario")
                 break
+            except EOFError:
+                # Se terminó la entrada (archivo o tubería): no hay más opciones que leer
+                print("\n\n👋 Fin de la entrada")
+                break
             except Exception as e:
                 print(f"\n❌ Error inesperado: {e}")
                 print("💡 Intente nuevamente o contacte al soporte técnico")
@@ -40,16 +40,20 @@ __version__ = "1.0.0-academica"
 __author__ = "Proyecto Académico Axanet"
 __email__ = "estudiante@universidad.edu"
 
-# Exportar clases principales para importación fácil
-from .modelos import Cliente, Servicio
-from .cliente_manager import ClienteManager
-from .excepciones import (
-    ClienteError, 
-    ClienteNoEncontradoError, 
-    ClienteExisteError,
-    ErrorValidacion,
-    ErrorArchivo
-)
+# Exportar clases principales para importación fácil.
+# Se cargan de forma perezosa (PEP 562): "import axanet" no importa ningún
+# submódulo hasta que se pide una de estas clases, así la CLI en inglés
+# no paga la importación de los módulos en español y viceversa.
+_IMPORTACIONES_PEREZOSAS = {
+    "Cliente": ".modelos",
+    "Servicio": ".modelos",
+    "ClienteManager": ".cliente_manager",
+    "ClienteError": ".excepciones",
+    "ClienteNoEncontradoError": ".excepciones",
+    "ClienteExisteError": ".excepciones",
+    "ErrorValidacion": ".excepciones",
+    "ErrorArchivo": ".excepciones",
+}
 
 __all__ = [
     "Cliente",
@@ -60,4 +64,22 @@ __all__ = [
     "ClienteExisteError",
     "ErrorValidacion",
     "ErrorArchivo"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(nombre):
+    """Importa el submódulo de una clase exportada la primera vez que se usa."""
+    modulo = _IMPORTACIONES_PEREZOSAS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    
+    from importlib import import_module
+    valor = getattr(import_module(modulo, __name__), nombre)
+    # Guardarlo en el módulo para que los siguientes accesos no pasen por aquí
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    """Incluye las clases perezosas en dir(axanet)."""
+    return sorted(set(globals()) | set(__all__))
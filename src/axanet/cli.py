@@ -10,7 +10,7 @@ Features:
 - Interactive and non-interactive modes
 - Subcommands for different operations
 - Input validation and error handling
-- Colored output and progress indicators
+- Colored output
 - Help documentation for all commands
 
 Educational Notes for Students:
@@ -18,7 +18,7 @@ Educational Notes for Students:
 1. Click framework provides professional CLI capabilities
 2. Command groups organize related functionality
 3. Input validation prevents errors and improves UX
-4. Progress indicators provide feedback for long operations
+4. Progress indicators belong on long operations, not single quick steps
 5. Context management ensures proper resource cleanup
 6. Error handling provides meaningful feedback to users
 
@@ -30,20 +30,25 @@ Design Patterns Used:
 """
 
 import click
+import functools
 import logging
-from typing import Optional
+import os
+from typing import TYPE_CHECKING, Dict, Optional
 import sys
-from pathlib import Path
 
-# Add src to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from axanet.services import ClientManager
-from axanet.models import Client
 from axanet.exceptions import ClientError, ClientNotFoundError, ClientExistsError, ValidationError
 from axanet.config import get_config
 from axanet.utils import setup_logging, get_user_confirmation, create_table_display
 
+if TYPE_CHECKING:
+    # Imported for annotations only; services is loaded on first use
+    from axanet.services import ClientManager
+    from axanet.models import Client
+
+
+# Module-level logger shared by every command
+logger = logging.getLogger(__name__)
+
 
 class AxanetCLI:
     """
@@ -62,6 +67,8 @@ class AxanetCLI:
         """Initialize CLI application."""
         self.config = get_config()
         self.client_manager = None
+        # Clients already looked up during this invocation, keyed by the name typed
+        self._client_cache: Dict[str, "Client"] = {}
         self._setup_logging()
     
     def _setup_logging(self):
@@ -69,29 +76,125 @@ class AxanetCLI:
         setup_logging(
             log_file=self.config.logging.file_name,
             log_level=self.config.logging.level,
-            console_output=self.config.debug
+            max_file_size_mb=self.config.logging.max_file_size_mb,
+            backup_count=self.config.logging.backup_count,
+            console_output=self.config.debug,
+            buffer_records=self.config.logging.buffer_records
         )
-        self.logger = logging.getLogger(__name__)
     
-    def get_client_manager(self) -> ClientManager:
-        """Get or create client manager instance."""
+    def get_client_manager(self) -> "ClientManager":
+        """
+        Get or create client manager instance.
+        
+        Educational Note:
+            The services module (and the models it pulls in) is imported
+            here instead of at the top of the file, so commands that never
+            touch client data, such as --help, do not pay for loading it.
+        """
         if self.client_manager is None:
+            from axanet.services import ClientManager
             try:
                 self.client_manager = ClientManager()
             except Exception as e:
                 click.echo(f"Error initializing client manager: {e}", err=True)
                 sys.exit(1)
         return self.client_manager
+    
+    def get_client_cached(self, name: str) -> "Client":
+        """
+        Look up a client, reusing the result of an earlier lookup of the same name.
+        
+        Educational Note:
+            Interactive sessions often look up the same client several times
+            (show, then update, then delete). Remembering the answer for the
+            rest of the invocation skips the repeated lookup work.
+        """
+        client = self._client_cache.get(name)
+        if client is None:
+            client = self.get_client_manager().get_client(name)
+            self._client_cache[name] = client
+        return client
+    
+    def forget_clients(self) -> None:
+        """Drop remembered lookups after clients are created, updated or deleted."""
+        self._client_cache.clear()
 
 
-# Global CLI instance
-cli_app = AxanetCLI()
+def cli_error_handler(operation: str, unexpected_message: str = "Unexpected error"):
+    """
+    Report command errors the same way for every subcommand.
+    
+    Args:
+        operation (str): Command name used in the log message
+        unexpected_message (str): Prefix shown for errors that are not client errors
+        
+    Educational Note:
+        Each command used to repeat the same try/except ladder. Wrapping the
+        commands in one decorator keeps their bodies to the happy path and
+        gives every command the same error messages.
+    """
+    def decorator(command):
+        @functools.wraps(command)
+        def wrapper(*args, **kwargs):
+            try:
+                return command(*args, **kwargs)
+            except (ClientNotFoundError, ClientExistsError) as e:
+                click.echo(f"Error: {e}", err=True)
+            except ValidationError as e:
+                click.echo(f"Validation Error: {e}", err=True)
+            except Exception as e:
+                click.echo(f"{unexpected_message}: {e}", err=True)
+                logger.error("CLI %s error: %s", operation, e)
+        return wrapper
+    return decorator
+
+
+# Output templates, built once at import time; the bound format methods are
+# called per client instead of evaluating an f-string block in every loop
+_DETAILED_CLIENT_BLOCK = (
+    "{index}. {name}\n"
+    "   ID: {client_id}\n"
+    "   Phone: {phone}\n"
+    "   Email: {email}\n"
+    "   Registration: {registration}\n"
+    "   Services: {service_count}\n"
+).format
+_SEARCH_RESULT_BLOCK = (
+    "{index}. {name}\n"
+    "   Phone: {phone}\n"
+    "   Email: {email}\n"
+    "   Services: {service_count}\n"
+).format
+_SERVICE_LINE = "  {index}. {description} ({date})".format
+_INTERACTIVE_CLIENT_BLOCK = (
+    "\nClient: {name}\n"
+    "ID: {client_id}\n"
+    "Phone: {phone}\n"
+    "Email: {email}\n"
+    "Services: {service_count}"
+).format
+_INTERACTIVE_LIST_LINE = "{index}. {name} - {service_count} services".format
+
+
+# Interactive mode menu, written with one echo per loop iteration
+INTERACTIVE_MENU = "\n".join([
+    "\nAvailable Operations:",
+    "1. Create new client",
+    "2. List all clients",
+    "3. Show client details",
+    "4. Update client (add service)",
+    "5. Delete client",
+    "6. Search clients",
+    "7. Show statistics",
+    "8. Exit",
+])
 
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="Axanet Client Manager")
 @click.option('--debug', is_flag=True, help='Enable debug output')
-def cli(debug):
+@click.pass_context
+def cli(ctx, debug):
     """
     Axanet Client Manager - Professional client data management system.
     
@@ -111,7 +214,16 @@ def cli(debug):
         
         # Add service to existing client
         axanet update "Ana Garcia" "New web development project"
+    
+    Educational Note:
+        The AxanetCLI instance (configuration and logging setup) is only
+        built when a subcommand actually runs and is passed to it through
+        the Click context, so --help and --version stay cheap.
     """
+    if ctx.invoked_subcommand is None:
+        return
+    
+    cli_app = ctx.ensure_object(AxanetCLI)
     if debug:
         cli_app.config.debug = True
         cli_app._setup_logging()
@@ -122,7 +234,9 @@ def cli(debug):
 @click.option('--phone', prompt='Phone number', help='Client phone number')
 @click.option('--email', prompt='Email address', help='Client email address')
 @click.option('--service', prompt='First service description', help='Description of the first service')
-def create(name: str, phone: str, email: str, service: str):
+@click.pass_obj
+@cli_error_handler("create")
+def create(cli_app: AxanetCLI, name: str, phone: str, email: str, service: str):
     """
     Create a new client with initial service.
     
@@ -133,90 +247,80 @@ def create(name: str, phone: str, email: str, service: str):
         The @click.option decorator with prompt=True creates interactive
         prompts for missing arguments, improving user experience.
     """
-    try:
-        client_manager = cli_app.get_client_manager()
-        
-        # Validate inputs
-        if not name.strip():
-            click.echo("Error: Client name cannot be empty", err=True)
-            return
-        
-        # Create client
-        with click.progressbar(length=1, label='Creating client') as bar:
-            client = client_manager.create_client(name, phone, email, service)
-            bar.update(1)
-        
-        click.echo(f"\n✓ Successfully created client: {client.name}")
-        click.echo(f"  Client ID: {client.client_id}")
-        click.echo(f"  File saved to: {client.normalized_name}.txt")
-        
-        cli_app.logger.info(f"CLI: Created client {client.name}")
-        
-    except ClientExistsError as e:
-        click.echo(f"Error: {e}", err=True)
-    except ValidationError as e:
-        click.echo(f"Validation Error: {e}", err=True)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        cli_app.logger.error(f"CLI create error: {e}")
+    client_manager = cli_app.get_client_manager()
+    
+    # Validate inputs
+    if not name.strip():
+        click.echo("Error: Client name cannot be empty", err=True)
+        return
+    
+    # Create client
+    client = client_manager.create_client(name, phone, email, service)
+    cli_app.forget_clients()
+    
+    click.echo(f"\n✓ Successfully created client: {client.name}")
+    click.echo(f"  Client ID: {client.client_id}")
+    click.echo(f"  File saved to: {client.normalized_name}.txt")
+    
+    logger.info("CLI: Created client %s", client.name)
 
 
 @cli.command()
 @click.option('--format', type=click.Choice(['table', 'detailed']), default='table',
               help='Output format for client list')
-def list(format: str):
+@click.pass_obj
+@cli_error_handler("list", "Error listing clients")
+def list(cli_app: AxanetCLI, format: str):
     """
     List all registered clients.
     
     This command displays all clients in the system with their basic information.
     Use different formats to control the level of detail shown.
     """
-    try:
-        client_manager = cli_app.get_client_manager()
-        clients = client_manager.get_all_clients()
-        
-        if not clients:
-            click.echo("No clients found in the system.")
-            return
-        
-        click.echo(f"\nFound {len(clients)} client(s):\n")
-        
-        if format == 'table':
-            # Display as formatted table
-            headers = ['Name', 'Phone', 'Email', 'Services']
-            rows = []
-            
-            for client in clients:
-                rows.append([
-                    client.name,
-                    client.phone,
-                    client.email,
-                    str(len(client.services))
-                ])
-            
-            table = create_table_display(headers, rows)
-            click.echo(table)
-            
-        else:  # detailed format
-            for i, client in enumerate(clients, 1):
-                click.echo(f"{i}. {client.name}")
-                click.echo(f"   ID: {client.client_id}")
-                click.echo(f"   Phone: {client.phone}")
-                click.echo(f"   Email: {client.email}")
-                click.echo(f"   Registration: {client.registration_date.strftime('%Y-%m-%d')}")
-                click.echo(f"   Services: {len(client.services)}")
-                click.echo()
-        
-        cli_app.logger.info(f"CLI: Listed {len(clients)} clients")
-        
-    except Exception as e:
-        click.echo(f"Error listing clients: {e}", err=True)
-        cli_app.logger.error(f"CLI list error: {e}")
+    client_manager = cli_app.get_client_manager()
+    client_count = client_manager.get_client_count()
+    
+    if not client_count:
+        click.echo("No clients found in the system.")
+        return
+    
+    click.echo(f"\nFound {client_count} client(s):\n")
+    
+    # Clients are streamed from the manager instead of copied into a list first
+    if format == 'table':
+        # Display as formatted table
+        headers = ['Name', 'Phone', 'Email', 'Services']
+        rows = [
+            [client.name, client.phone, client.email, str(len(client.services))]
+            for client in client_manager.iter_clients()
+        ]
+        
+        table = create_table_display(headers, rows)
+        click.echo(table)
+        
+    else:  # detailed format
+        # One block per client, all written with a single echo
+        click.echo("\n".join(
+            _DETAILED_CLIENT_BLOCK(
+                index=i,
+                name=client.name,
+                client_id=client.client_id,
+                phone=client.phone,
+                email=client.email,
+                registration=client.registration_date.date().isoformat(),
+                service_count=len(client.services),
+            )
+            for i, client in enumerate(client_manager.iter_clients(), 1)
+        ))
+    
+    logger.info("CLI: Listed %d clients", client_count)
 
 
 @cli.command()
 @click.argument('name')
-def show(name: str):
+@click.pass_obj
+@cli_error_handler("show")
+def show(cli_app: AxanetCLI, name: str):
     """
     Show detailed information for a specific client.
     
@@ -225,38 +329,43 @@ def show(name: str):
     This command displays all available information for a client,
     including their service history.
     """
-    try:
-        client_manager = cli_app.get_client_manager()
-        client = client_manager.get_client(name)
-        
-        click.echo(f"\n📋 Client Details: {client.name}")
-        click.echo("=" * 50)
-        click.echo(f"Client ID: {client.client_id}")
-        click.echo(f"Phone: {client.phone}")
-        click.echo(f"Email: {client.email}")
-        click.echo(f"Registration Date: {client.registration_date.strftime('%Y-%m-%d')}")
-        click.echo(f"\n🔧 Services ({len(client.services)}):")
-        
-        if client.services:
-            for i, service in enumerate(client.services, 1):
-                date_str = service.date_requested.strftime('%Y-%m-%d')
-                click.echo(f"  {i}. {service.description} ({date_str})")
-        else:
-            click.echo("  No services registered yet")
-        
-        cli_app.logger.info(f"CLI: Showed client {client.name}")
-        
-    except ClientNotFoundError as e:
-        click.echo(f"Error: {e}", err=True)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        cli_app.logger.error(f"CLI show error: {e}")
+    client = cli_app.get_client_cached(name)
+    services = client.services
+    service_count = len(services)
+    
+    lines = [
+        f"\n📋 Client Details: {client.name}",
+        "=" * 50,
+        f"Client ID: {client.client_id}",
+        f"Phone: {client.phone}",
+        f"Email: {client.email}",
+        f"Registration Date: {client.registration_date.date().isoformat()}",
+        f"\n🔧 Services ({service_count}):",
+    ]
+    
+    if service_count:
+        lines.extend(
+            _SERVICE_LINE(
+                index=i,
+                description=service.description,
+                date=service.date_requested.date().isoformat(),
+            )
+            for i, service in enumerate(services, 1)
+        )
+    else:
+        lines.append("  No services registered yet")
+    
+    click.echo("\n".join(lines))
+    
+    logger.info("CLI: Showed client %s", client.name)
 
 
 @cli.command()
 @click.argument('name')
 @click.argument('service_description')
-def update(name: str, service_description: str):
+@click.pass_obj
+@cli_error_handler("update")
+def update(cli_app: AxanetCLI, name: str, service_description: str):
     """
     Add a new service to an existing client.
     
@@ -266,38 +375,30 @@ def update(name: str, service_description: str):
     This command adds a new service entry to the client's record
     with the current date.
     """
-    try:
-        client_manager = cli_app.get_client_manager()
-        
-        # Validate service description
-        if not service_description.strip():
-            click.echo("Error: Service description cannot be empty", err=True)
-            return
-        
-        # Update client
-        with click.progressbar(length=1, label='Adding service') as bar:
-            client = client_manager.update_client(name, service_description)
-            bar.update(1)
-        
-        click.echo(f"\n✓ Successfully added service to {client.name}")
-        click.echo(f"  Service: {service_description}")
-        click.echo(f"  Total services: {len(client.services)}")
-        
-        cli_app.logger.info(f"CLI: Updated client {client.name} with service")
-        
-    except ClientNotFoundError as e:
-        click.echo(f"Error: {e}", err=True)
-    except ValidationError as e:
-        click.echo(f"Validation Error: {e}", err=True)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        cli_app.logger.error(f"CLI update error: {e}")
+    client_manager = cli_app.get_client_manager()
+    
+    # Validate service description
+    if not service_description.strip():
+        click.echo("Error: Service description cannot be empty", err=True)
+        return
+    
+    # Update client
+    client = client_manager.update_client(name, service_description)
+    cli_app.forget_clients()
+    
+    click.echo(f"\n✓ Successfully added service to {client.name}")
+    click.echo(f"  Service: {service_description}")
+    click.echo(f"  Total services: {len(client.services)}")
+    
+    logger.info("CLI: Updated client %s with service", client.name)
 
 
 @cli.command()
 @click.argument('name')
 @click.option('--force', is_flag=True, help='Skip confirmation prompt')
-def delete(name: str, force: bool):
+@click.pass_obj
+@cli_error_handler("delete")
+def delete(cli_app: AxanetCLI, name: str, force: bool):
     """
     Delete a client and their file.
     
@@ -306,41 +407,35 @@ def delete(name: str, force: bool):
     This command permanently removes a client record and their data file.
     Use with caution as this operation cannot be undone.
     """
-    try:
-        client_manager = cli_app.get_client_manager()
-        
-        # Verify client exists and get details
-        client = client_manager.get_client(name)
-        
-        click.echo(f"\n⚠️  About to delete client: {client.name}")
-        click.echo(f"   Client ID: {client.client_id}")
-        click.echo(f"   Services: {len(client.services)}")
-        
-        # Confirmation
-        if not force:
-            if not get_user_confirmation("Are you sure you want to delete this client?"):
-                click.echo("Operation cancelled.")
-                return
-        
-        # Delete client
-        with click.progressbar(length=1, label='Deleting client') as bar:
-            client_manager.delete_client(name)
-            bar.update(1)
-        
-        click.echo(f"\n✓ Successfully deleted client: {name}")
-        
-        cli_app.logger.info(f"CLI: Deleted client {name}")
-        
-    except ClientNotFoundError as e:
-        click.echo(f"Error: {e}", err=True)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        cli_app.logger.error(f"CLI delete error: {e}")
+    client_manager = cli_app.get_client_manager()
+    
+    # Verify client exists and get details
+    client = cli_app.get_client_cached(name)
+    
+    click.echo(f"\n⚠️  About to delete client: {client.name}")
+    click.echo(f"   Client ID: {client.client_id}")
+    click.echo(f"   Services: {len(client.services)}")
+    
+    # Confirmation
+    if not force:
+        if not get_user_confirmation("Are you sure you want to delete this client?"):
+            click.echo("Operation cancelled.")
+            return
+    
+    # Delete client
+    client_manager.delete_client(name, client)
+    cli_app.forget_clients()
+    
+    click.echo(f"\n✓ Successfully deleted client: {name}")
+    
+    logger.info("CLI: Deleted client %s", name)
 
 
 @cli.command()
 @click.argument('query')
-def search(query: str):
+@click.pass_obj
+@cli_error_handler("search", "Error searching clients")
+def search(cli_app: AxanetCLI, query: str):
     """
     Search for clients by name, email, or phone.
     
@@ -349,77 +444,191 @@ def search(query: str):
     This command searches through all client records and displays
     matching results.
     """
-    try:
-        client_manager = cli_app.get_client_manager()
-        
-        if len(query.strip()) < 2:
-            click.echo("Error: Search query must be at least 2 characters long", err=True)
-            return
-        
-        clients = client_manager.search_clients(query)
-        
-        if not clients:
-            click.echo(f"No clients found matching '{query}'")
-            return
-        
-        click.echo(f"\nFound {len(clients)} client(s) matching '{query}':\n")
-        
-        for i, client in enumerate(clients, 1):
-            click.echo(f"{i}. {client.name}")
-            click.echo(f"   Phone: {client.phone}")
-            click.echo(f"   Email: {client.email}")
-            click.echo(f"   Services: {len(client.services)}")
-            click.echo()
-        
-        cli_app.logger.info(f"CLI: Searched for '{query}', found {len(clients)} results")
-        
-    except Exception as e:
-        click.echo(f"Error searching clients: {e}", err=True)
-        cli_app.logger.error(f"CLI search error: {e}")
+    client_manager = cli_app.get_client_manager()
+    
+    if len(query.strip()) < 2:
+        click.echo("Error: Search query must be at least 2 characters long", err=True)
+        return
+    
+    clients = client_manager.search_clients(query)
+    
+    if not clients:
+        click.echo(f"No clients found matching '{query}'")
+        return
+    
+    lines = [f"\nFound {len(clients)} client(s) matching '{query}':\n"]
+    lines.extend(
+        _SEARCH_RESULT_BLOCK(
+            index=i,
+            name=client.name,
+            phone=client.phone,
+            email=client.email,
+            service_count=len(client.services),
+        )
+        for i, client in enumerate(clients, 1)
+    )
+    
+    click.echo("\n".join(lines))
+    
+    logger.info("CLI: Searched for '%s', found %d results", query, len(clients))
 
 
 @cli.command()
-def stats():
+@click.pass_obj
+@cli_error_handler("stats", "Error getting statistics")
+def stats(cli_app: AxanetCLI):
     """
     Display system statistics.
     
     This command shows various statistics about the client database
     including total clients, services, and usage patterns.
     """
+    client_manager = cli_app.get_client_manager()
+    statistics = client_manager.get_statistics()
+    
+    click.echo("\n".join([
+        "\n📊 System Statistics",
+        "=" * 30,
+        f"Total Clients: {statistics['total_clients']}",
+        f"Total Services: {statistics['total_services']}",
+        f"Avg Services/Client: {statistics['average_services_per_client']}",
+    ]))
+    
+    # Additional info (reuse the configuration loaded at startup)
+    data_dir = cli_app.config.database.full_path
+    click.echo(f"\nData Directory: {data_dir}")
+    click.echo(f"Directory exists: {data_dir.exists()}")
+    
+    if data_dir.exists():
+        # Count straight from the directory entries: no Path objects,
+        # and is_file() uses the type scandir already read
+        file_extension = cli_app.config.database.file_extension
+        with os.scandir(data_dir) as entries:
+            file_count = sum(1 for entry in entries
+                             if entry.name.endswith(file_extension)
+                             and entry.is_file(follow_symlinks=False))
+        click.echo(f"Files in directory: {file_count}")
+    
+    logger.info("CLI: Displayed statistics")
+
+
+def _handle_create(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 1: create a new client."""
+    # Ask with the create command's own option prompts, then run the command
+    # itself so its validation and error handling are not duplicated here
+    values = {param.name: click.prompt(param.prompt) for param in create.params}
+    click.get_current_context().invoke(create, **values)
+
+
+def _handle_list(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 2: list all clients."""
+    clients = client_manager.get_all_clients()
+    if clients:
+        click.echo(f"\nClients ({len(clients)}):")
+        # Build the whole listing first and write it with a single echo
+        click.echo("\n".join(
+            _INTERACTIVE_LIST_LINE(index=i, name=client.name, service_count=len(client.services))
+            for i, client in enumerate(clients, 1)
+        ))
+    else:
+        click.echo("No clients found.")
+
+
+def _handle_show(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 3: show one client's details."""
+    name = click.prompt("Client name")
     try:
-        client_manager = cli_app.get_client_manager()
-        statistics = client_manager.get_statistics()
-        
-        click.echo("\n📊 System Statistics")
-        click.echo("=" * 30)
-        click.echo(f"Total Clients: {statistics['total_clients']}")
-        click.echo(f"Total Services: {statistics['total_services']}")
-        click.echo(f"Avg Services/Client: {statistics['average_services_per_client']}")
-        
-        # Additional info
-        config = get_config()
-        data_dir = config.database.full_path
-        click.echo(f"\nData Directory: {data_dir}")
-        click.echo(f"Directory exists: {data_dir.exists()}")
-        
-        if data_dir.exists():
-            file_count = len(list(data_dir.glob("*.txt")))
-            click.echo(f"Files in directory: {file_count}")
-        
-        cli_app.logger.info("CLI: Displayed statistics")
-        
+        client = cli_app.get_client_cached(name)
+        click.echo(_INTERACTIVE_CLIENT_BLOCK(
+            name=client.name,
+            client_id=client.client_id,
+            phone=client.phone,
+            email=client.email,
+            service_count=len(client.services),
+        ))
+    except ClientNotFoundError:
+        click.echo("Client not found.")
+
+
+def _handle_update(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 4: add a service to a client."""
+    name = click.prompt("Client name")
+    service = click.prompt("New service description")
+    try:
+        client = client_manager.update_client(name, service)
+        cli_app.forget_clients()
+        click.echo(f"✓ Added service to {client.name}")
+    except ClientNotFoundError:
+        click.echo("Client not found.")
     except Exception as e:
-        click.echo(f"Error getting statistics: {e}", err=True)
-        cli_app.logger.error(f"CLI stats error: {e}")
+        click.echo(f"Error: {e}")
+
+
+def _handle_delete(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 5: delete a client after confirmation."""
+    name = click.prompt("Client name to delete")
+    try:
+        client = cli_app.get_client_cached(name)
+        if get_user_confirmation(f"Delete {client.name}?"):
+            client_manager.delete_client(name, client)
+            cli_app.forget_clients()
+            click.echo(f"✓ Deleted client: {name}")
+        else:
+            click.echo("Operation cancelled.")
+    except ClientNotFoundError:
+        click.echo("Client not found.")
+    except Exception as e:
+        click.echo(f"Error: {e}")
+
+
+def _handle_search(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 6: search clients."""
+    query = click.prompt("Search query")
+    clients = client_manager.search_clients(query)
+    if clients:
+        click.echo(f"\nFound {len(clients)} matching clients:")
+        click.echo("\n".join(f"- {client.name}" for client in clients))
+    else:
+        click.echo("No matching clients found.")
+
+
+def _handle_stats(cli_app: AxanetCLI, client_manager: "ClientManager") -> None:
+    """Interactive option 7: show statistics."""
+    statistics = client_manager.get_statistics()
+    click.echo(
+        f"\nTotal Clients: {statistics['total_clients']}\n"
+        f"Total Services: {statistics['total_services']}\n"
+        f"Average Services per Client: {statistics['average_services_per_client']}"
+    )
+
+
+# Interactive menu dispatch table, built once: option number -> handler.
+# Option 8 (exit) is handled by the loop itself.
+EXIT_CHOICE = 8
+INTERACTIVE_HANDLERS = {
+    1: _handle_create,
+    2: _handle_list,
+    3: _handle_show,
+    4: _handle_update,
+    5: _handle_delete,
+    6: _handle_search,
+    7: _handle_stats,
+}
 
 
 @cli.command()
-def interactive():
+@click.pass_obj
+def interactive(cli_app: AxanetCLI):
     """
     Start interactive mode with menu-driven interface.
     
     This command provides a traditional menu-driven interface
     for users who prefer interactive operation.
+    
+    Educational Note:
+        Each option maps to a handler function in INTERACTIVE_HANDLERS, so
+        choosing an option is one dictionary lookup instead of walking an
+        if/elif chain.
     """
     click.echo("🏢 Axanet Client Manager - Interactive Mode")
     click.echo("=" * 50)
@@ -428,98 +637,19 @@ def interactive():
     
     while True:
         try:
-            click.echo("\nAvailable Operations:")
-            click.echo("1. Create new client")
-            click.echo("2. List all clients") 
-            click.echo("3. Show client details")
-            click.echo("4. Update client (add service)")
-            click.echo("5. Delete client")
-            click.echo("6. Search clients")
-            click.echo("7. Show statistics")
-            click.echo("8. Exit")
+            click.echo(INTERACTIVE_MENU)
             
             choice = click.prompt("\nSelect an option", type=int)
             
-            if choice == 1:
-                name = click.prompt("Client name")
-                phone = click.prompt("Phone number")
-                email = click.prompt("Email address")
-                service = click.prompt("First service description")
-                
-                try:
-                    client = client_manager.create_client(name, phone, email, service)
-                    click.echo(f"✓ Created client: {client.name}")
-                except Exception as e:
-                    click.echo(f"Error: {e}")
-                    
-            elif choice == 2:
-                clients = client_manager.get_all_clients()
-                if clients:
-                    click.echo(f"\nClients ({len(clients)}):")
-                    for i, client in enumerate(clients, 1):
-                        click.echo(f"{i}. {client.name} - {len(client.services)} services")
-                else:
-                    click.echo("No clients found.")
-                    
-            elif choice == 3:
-                name = click.prompt("Client name")
-                try:
-                    client = client_manager.get_client(name)
-                    click.echo(f"\nClient: {client.name}")
-                    click.echo(f"ID: {client.client_id}")
-                    click.echo(f"Phone: {client.phone}")
-                    click.echo(f"Email: {client.email}")
-                    click.echo(f"Services: {len(client.services)}")
-                except ClientNotFoundError:
-                    click.echo("Client not found.")
-                    
-            elif choice == 4:
-                name = click.prompt("Client name")
-                service = click.prompt("New service description")
-                try:
-                    client = client_manager.update_client(name, service)
-                    click.echo(f"✓ Added service to {client.name}")
-                except ClientNotFoundError:
-                    click.echo("Client not found.")
-                except Exception as e:
-                    click.echo(f"Error: {e}")
-                    
-            elif choice == 5:
-                name = click.prompt("Client name to delete")
-                try:
-                    client = client_manager.get_client(name)
-                    if get_user_confirmation(f"Delete {client.name}?"):
-                        client_manager.delete_client(name)
-                        click.echo(f"✓ Deleted client: {name}")
-                    else:
-                        click.echo("Operation cancelled.")
-                except ClientNotFoundError:
-                    click.echo("Client not found.")
-                except Exception as e:
-                    click.echo(f"Error: {e}")
-                    
-            elif choice == 6:
-                query = click.prompt("Search query")
-                clients = client_manager.search_clients(query)
-                if clients:
-                    click.echo(f"\nFound {len(clients)} matching clients:")
-                    for client in clients:
-                        click.echo(f"- {client.name}")
-                else:
-                    click.echo("No matching clients found.")
-                    
-            elif choice == 7:
-                stats = client_manager.get_statistics()
-                click.echo(f"\nTotal Clients: {stats['total_clients']}")
-                click.echo(f"Total Services: {stats['total_services']}")
-                click.echo(f"Average Services per Client: {stats['average_services_per_client']}")
-                
-            elif choice == 8:
-                click.echo("Goodbye!")
-                break
-                
-            else:
+            handler = INTERACTIVE_HANDLERS.get(choice)
+            if handler is None:
+                if choice == EXIT_CHOICE:
+                    click.echo("Goodbye!")
+                    break
                 click.echo("Invalid choice. Please select 1-8.")
+                continue
+            
+            handler(cli_app, client_manager)
                 
         except (KeyboardInterrupt, EOFError):
             click.echo("\nGoodbye!")
@@ -527,6 +657,5 @@ def interactive():
         except Exception as e:
             click.echo(f"Unexpected error: {e}")
 
-
 if __name__ == '__main__':
     cli()
\ No newline at end of file
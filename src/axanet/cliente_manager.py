@@ -20,11 +20,14 @@ La clase ClienteManager es el corazón del sistema y demuestra:
 - Manejo de errores
 """
 
+import logging
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from .modelos import Cliente, Servicio
+from .modelos import Cliente, Servicio, normalizar_clave
 from .excepciones import (
     ClienteError,
     ClienteNoEncontradoError,
@@ -34,6 +37,83 @@ from .excepciones import (
 )
 
 
+# Mensajes de seguimiento del gestor; son de nivel DEBUG, así que quien no
+# los habilite solo paga la comprobación del nivel (main.py los muestra)
+logger = logging.getLogger(__name__)
+
+# Por debajo de este número de archivos pendientes, crear los hilos cuesta
+# más que lo que se gana solapando las lecturas: se leen en el hilo actual
+_MINIMO_ARCHIVOS_EN_PARALELO = 8
+
+
+class _TrieNombres:
+    """
+    Árbol de prefijos (trie) de nombres normalizados.
+    
+    Cada nodo es un diccionario carácter → nodo hijo. Buscar los nombres que
+    empiezan con un prefijo cuesta lo que mide el prefijo más los resultados,
+    sin recorrer todos los clientes.
+    """
+    
+    # Marca de fin de nombre; "" nunca es un carácter de una clave
+    _FIN = ""
+    
+    def __init__(self, claves=()):
+        self._raiz: dict = {}
+        for clave in claves:
+            self.insertar(clave)
+    
+    def insertar(self, clave: str):
+        """Agrega un nombre normalizado al árbol."""
+        nodo = self._raiz
+        for caracter in clave:
+            nodo = nodo.setdefault(caracter, {})
+        nodo[self._FIN] = True
+    
+    def eliminar(self, clave: str):
+        """Quita un nombre del árbol y poda las ramas que quedan vacías."""
+        camino = []
+        nodo = self._raiz
+        for caracter in clave:
+            hijo = nodo.get(caracter)
+            if hijo is None:
+                return
+            camino.append((nodo, caracter))
+            nodo = hijo
+        
+        if nodo.pop(self._FIN, None) is None:
+            return
+        
+        # Podar de abajo hacia arriba mientras los nodos queden vacíos
+        for padre, caracter in reversed(camino):
+            if padre[caracter]:
+                break
+            del padre[caracter]
+    
+    def con_prefijo(self, prefijo: str, limite: int) -> List[str]:
+        """
+        Devuelve hasta 'limite' nombres que empiezan con 'prefijo', en orden alfabético.
+        """
+        nodo = self._raiz
+        for caracter in prefijo:
+            nodo = nodo.get(caracter)
+            if nodo is None:
+                return []
+        
+        encontrados = []
+        # Recorrido en profundidad; los hijos se apilan en orden inverso
+        # para visitarlos en orden alfabético
+        pila = [(prefijo, nodo)]
+        while pila and len(encontrados) < limite:
+            texto, nodo = pila.pop()
+            if self._FIN in nodo:
+                encontrados.append(texto)
+            for caracter in sorted((c for c in nodo if c != self._FIN), reverse=True):
+                pila.append((texto + caracter, nodo[caracter]))
+        
+        return encontrados
+
+
 class ClienteManager:
     """
     Gestor principal de clientes que utiliza una tabla hash para almacenamiento en memoria.
@@ -46,15 +126,19 @@ class ClienteManager:
     
     Atributos:
         _cache_clientes: Diccionario (tabla hash) que mapea nombre_normalizado → Cliente
+        _indice_archivos: Diccionario que mapea nombre_normalizado → ruta del archivo
         directorio_datos: Carpeta donde se guardan los archivos de clientes
     """
     
-    def __init__(self, directorio_datos: str = "axanet_clients_data"):
+    def __init__(self, directorio_datos: str = "axanet_clients_data",
+                 escritura_durable: bool = False):
         """
         Inicializa el gestor de clientes.
         
         Args:
             directorio_datos: Nombre de la carpeta donde se guardan los archivos
+            escritura_durable: Si es True, cada archivo se sincroniza a disco
+                (fsync) antes de darlo por guardado
         """
         # TABLA HASH PRINCIPAL - Esta es la estructura de datos clave
         # Mapea nombre_normalizado (string) → objeto Cliente
@@ -63,19 +147,92 @@ class ClienteManager:
         
         # Configurar directorio de datos
         self.directorio_datos = Path(directorio_datos)
+        self.escritura_durable = escritura_durable
+        # Prefijo de las rutas como texto: cada ruta se arma concatenando,
+        # sin crear objetos Path (open, os.replace y os.unlink aceptan str)
+        self._prefijo_rutas = f"{self.directorio_datos}{os.sep}"
+        
+        # Crear el directorio si no existe. El mtime se toma antes de listar:
+        # un cambio durante el listado deja el índice marcado como
+        # posiblemente desactualizado
+        self._mtime_directorio = self._crear_directorio_datos()
+        
+        # ÍNDICE DE ARCHIVOS - nombre_normalizado → ruta del archivo (str)
+        # Solo se lista el directorio; el contenido de cada cliente se lee
+        # la primera vez que se necesita (carga perezosa)
+        self._indice_archivos: Dict[str, str] = self._escanear_directorio()
         
-        # Crear el directorio si no existe
-        self._crear_directorio_datos()
+        # True cuando todos los archivos del índice ya se intentaron cargar;
+        # junto con el mtime del directorio evita recorrer el índice en
+        # cada listado si nada cambió en disco
+        self._cache_completo = False
         
-        print(f"📁 Directorio de datos: {self.directorio_datos}")
-        print(f"🔧 Tabla hash inicializada (vacía)")
+        # Total de servicios de los clientes que están en la tabla hash; se
+        # actualiza con cada alta, servicio o baja en lugar de recontarse
+        self._total_servicios = 0
+        
+        # COLUMNAS PARALELAS de la tabla hash (estructura de arreglos): la
+        # posición i de cada lista corresponde al mismo cliente. Ordenar por
+        # nombre compara cadenas de una lista plana, sin leer atributos
+        # de cada objeto Cliente
+        self._posiciones: Dict[str, int] = {}
+        self._claves: List[str] = []
+        self._nombres: List[str] = []
+        
+        # Árbol de prefijos con los mismos nombres, para sugerir nombres
+        # parecidos cuando una búsqueda no encuentra al cliente
+        self._trie_nombres = _TrieNombres(self._indice_archivos)
+        
+        # Caché negativa: claves que ya se buscaron en disco sin encontrarse,
+        # para no repetir la consulta al sistema de archivos
+        self._claves_inexistentes: Set[str] = set()
+        
+        # Estadísticas memorizadas; _estadisticas_sucias indica que hubo un
+        # cambio (crear, agregar servicio, eliminar) y hay que recalcularlas
+        self._estadisticas_cache: Optional[Dict[str, Union[int, float]]] = None
+        self._estadisticas_sucias = True
+        
+        logger.debug("📁 Directorio de datos: %s", self.directorio_datos)
+        logger.debug("🔧 Tabla hash inicializada (vacía)")
+    
+    @staticmethod
+    def normalizar_nombre(nombre: str) -> str:
+        """
+        Normaliza un nombre para usarlo como clave en la tabla hash.
+        
+        Produce la misma clave que Cliente.nombre_normalizado, pero sin crear
+        un Cliente temporal ni ejecutar sus validaciones. Las pantallas del
+        menú lo llaman una sola vez con lo que escribe el usuario y pasan la
+        clave ya normalizada al gestor.
+        
+        Args:
+            nombre: Nombre a normalizar
+            
+        Returns:
+            Nombre normalizado (ej: "Ana García" → "ana_garcia")
+        """
+        # sys.intern: la clave buscada y la guardada en la tabla hash son el
+        # mismo objeto, así el diccionario las compara por identidad
+        return sys.intern(normalizar_clave(nombre))
     
-    def _crear_directorio_datos(self):
+    def _crear_directorio_datos(self) -> int:
         """
         Crea el directorio para los archivos de clientes si no existe.
+        
+        El stat() que lee el mtime del directorio también comprueba que
+        existe, así que mkdir solo se llama cuando de verdad falta.
+        
+        Returns:
+            Fecha de modificación del directorio en nanosegundos
         """
+        try:
+            return self._leer_mtime_directorio()
+        except FileNotFoundError:
+            pass
+        
         try:
             self.directorio_datos.mkdir(exist_ok=True)
+            return self._leer_mtime_directorio()
         except Exception as e:
             raise ErrorArchivo(
                 operacion="crear directorio",
@@ -83,18 +240,120 @@ class ClienteManager:
                 motivo=str(e)
             )
     
-    def _obtener_ruta_archivo(self, nombre_normalizado: str) -> Path:
+    def _escanear_directorio(self) -> Dict[str, str]:
+        """
+        Lista los archivos .txt de clientes del directorio de datos.
+        
+        os.scandir obtiene el nombre y el tipo de cada entrada al leer el
+        directorio, así que is_file() no necesita un stat() por archivo.
+        
+        Returns:
+            Diccionario nombre_normalizado → ruta del archivo
+        """
+        with os.scandir(self.directorio_datos) as entradas:
+            return {
+                sys.intern(entrada.name[:-4]): entrada.path
+                for entrada in entradas
+                if entrada.name.endswith(".txt") and entrada.is_file(follow_symlinks=False)
+            }
+    
+    def _agregar_a_cache(self, nuevos: Dict[str, Cliente]):
+        """
+        Agrega clientes que aún no estaban a la tabla hash y a sus columnas.
+        
+        Args:
+            nuevos: Diccionario nombre_normalizado → Cliente (claves nuevas)
+        """
+        # Un solo update(): como el origen es un dict de tamaño conocido, la
+        # tabla hash se redimensiona como mucho una vez en lugar de crecer
+        # paso a paso con cada inserción
+        self._cache_clientes.update(nuevos)
+        
+        posiciones, claves, nombres = self._posiciones, self._claves, self._nombres
+        for clave, cliente in nuevos.items():
+            posiciones[clave] = len(claves)
+            claves.append(clave)
+            nombres.append(cliente.nombre)
+            self._total_servicios += len(cliente.servicios)
+    
+    def _quitar_de_cache(self, clave: str):
+        """
+        Quita un cliente de la tabla hash y de sus columnas, si estaba.
+        
+        La última fila de las columnas pasa al hueco que deja la eliminada,
+        así quitar cuesta O(1) en lugar de desplazar todas las filas.
+        
+        Args:
+            clave: Nombre normalizado del cliente
+        """
+        cliente = self._cache_clientes.pop(clave, None)
+        if cliente is None:
+            return
+        self._total_servicios -= len(cliente.servicios)
+        
+        posicion = self._posiciones.pop(clave)
+        ultima_clave = self._claves.pop()
+        ultimo_nombre = self._nombres.pop()
+        if ultima_clave != clave:
+            self._claves[posicion] = ultima_clave
+            self._nombres[posicion] = ultimo_nombre
+            self._posiciones[ultima_clave] = posicion
+    
+    def _leer_mtime_directorio(self) -> int:
+        """
+        Devuelve la fecha de modificación del directorio de datos en nanosegundos.
+        
+        Crear, renombrar o borrar un archivo cambia esta fecha, así que sirve
+        para saber si el índice de archivos sigue al día con un solo stat().
+        """
+        return os.stat(self.directorio_datos).st_mtime_ns
+    
+    def _sincronizar_indice(self, mtime_directorio: int):
+        """
+        Vuelve a listar el directorio y aplica las diferencias al índice.
+        
+        Los archivos nuevos se agregan al índice y al árbol de prefijos; los
+        que ya no existen se quitan también de la tabla hash.
+        
+        Args:
+            mtime_directorio: Fecha de modificación leída antes de listar
+        """
+        anterior = self._indice_archivos
+        actual = self._escanear_directorio()
+        
+        for clave in anterior.keys() - actual.keys():
+            self._quitar_de_cache(clave)
+            self._trie_nombres.eliminar(clave)
+        nuevas = actual.keys() - anterior.keys()
+        for clave in nuevas:
+            self._trie_nombres.insertar(clave)
+        # El directorio cambió: las búsquedas fallidas anteriores caducan
+        self._claves_inexistentes.clear()
+        
+        if len(actual) != len(anterior) or nuevas:
+            self._estadisticas_sucias = True
+        
+        self._indice_archivos = actual
+        self._mtime_directorio = mtime_directorio
+        self._cache_completo = False
+    
+    def _obtener_ruta_archivo(self, nombre_normalizado: str) -> str:
         """
         Genera la ruta completa del archivo para un cliente.
         
+        Los clientes del índice ya tienen su ruta guardada; para los demás
+        se arma con el prefijo del directorio, sin crear un Path.
+        
         Args:
             nombre_normalizado: Nombre del cliente normalizado
             
         Returns:
             Ruta completa del archivo del cliente
         """
-        nombre_archivo = f"{nombre_normalizado}.txt"
-        return self.directorio_datos / nombre_archivo
+        ruta = self._indice_archivos.get(nombre_normalizado)
+        if ruta is None:
+            ruta = f"{self._prefijo_rutas}{nombre_normalizado}.txt"
+        return ruta
     
     def _cargar_cliente_desde_archivo(self, nombre_normalizado: str) -> Cliente:
         """
@@ -113,14 +372,16 @@ class ClienteManager:
         ruta_archivo = self._obtener_ruta_archivo(nombre_normalizado)
         
         # Verificar que el archivo existe
-        if not ruta_archivo.exists():
+        if not os.path.exists(ruta_archivo):
             # Intentar encontrar por nombre original sin normalizar
             nombre_original = nombre_normalizado.replace('_', ' ').title()
             raise ClienteNoEncontradoError(nombre_original)
         
         try:
-            # Leer el contenido del archivo
-            contenido = ruta_archivo.read_text(encoding='utf-8')
+            # Leer el contenido del archivo como bytes y decodificarlo de una
+            # vez (read_text crea un TextIOWrapper con su decodificador por llamada)
+            with open(ruta_archivo, 'rb') as archivo:
+                contenido = archivo.read().decode('utf-8')
             
             # Crear cliente desde el contenido
             cliente = Cliente.desde_archivo(contenido)
@@ -130,14 +391,44 @@ class ClienteManager:
         except Exception as e:
             raise ErrorArchivo(
                 operacion="leer",
-                nombre_archivo=str(ruta_archivo),
+                nombre_archivo=ruta_archivo,
                 motivo=str(e)
             )
     
+    @staticmethod
+    def _cargar_cliente_desde_bytes(ruta_archivo: str) -> Cliente:
+        """
+        Lee y reconstruye un cliente cuya ruta ya se conoce por el índice.
+        
+        A diferencia de _cargar_cliente_desde_archivo, no comprueba antes si
+        el archivo existe (el índice sale de listar el directorio) y lee el
+        archivo completo con un solo read() en modo binario, sin búfer
+        intermedio; el texto se decodifica después en memoria.
+        
+        Args:
+            ruta_archivo: Ruta del archivo del cliente
+            
+        Returns:
+            Objeto Cliente cargado desde el archivo
+        """
+        with open(ruta_archivo, 'rb', buffering=0) as archivo:
+            datos = archivo.read()
+        return Cliente.desde_archivo(datos.decode('utf-8'))
+    
     def _guardar_cliente_en_archivo(self, cliente: Cliente):
         """
         Guarda un cliente en su archivo correspondiente.
         
+        La escritura es atómica: el contenido se escribe primero en un
+        archivo temporal oculto (".nombre.txt.tmp", que el listado ignora) y
+        luego os.replace lo pone en lugar del archivo final. Si el programa
+        se interrumpe a mitad de la escritura, el archivo del cliente queda
+        con su versión anterior completa, nunca a medias.
+        
+        Con escritura_durable solo se sincroniza el archivo temporal; quien
+        guarde muchos clientes seguidos debería agruparlos (por ejemplo con
+        crear_clientes_lote) para no pagar un fsync por cada uno.
+        
         Args:
             cliente: Objeto Cliente a guardar
             
@@ -145,21 +436,120 @@ class ClienteManager:
             ErrorArchivo: Si hay problemas al escribir el archivo
         """
         ruta_archivo = self._obtener_ruta_archivo(cliente.nombre_normalizado)
+        ruta_temporal = f"{self._prefijo_rutas}.{cliente.nombre_normalizado}.txt.tmp"
         
         try:
-            # Convertir cliente a formato de archivo
-            contenido = cliente.a_formato_archivo()
+            # Convertir cliente a formato de archivo, ya codificado en UTF-8
+            contenido = cliente.a_formato_archivo().encode('utf-8')
+            
+            # Escribir el temporal (bytes: sin TextIOWrapper intermedio)
+            with open(ruta_temporal, 'wb') as archivo:
+                archivo.write(contenido)
+                if self.escritura_durable:
+                    archivo.flush()
+                    os.fsync(archivo.fileno())
             
-            # Escribir archivo
-            ruta_archivo.write_text(contenido, encoding='utf-8')
+            # Reemplazo atómico del archivo final
+            os.replace(ruta_temporal, ruta_archivo)
             
         except Exception as e:
+            # No dejar el temporal a medias en el directorio
+            try:
+                os.unlink(ruta_temporal)
+            except OSError:
+                pass
+
             raise ErrorArchivo(
                 operacion="escribir",
-                nombre_archivo=str(ruta_archivo),
+                nombre_archivo=ruta_archivo,
                 motivo=str(e)
             )
     
+    def _crear_archivo_nuevo(self, clave: str, contenido: bytes):
+        """
+        Crea el archivo de un cliente nuevo sin pisar uno que ya exista.
+        
+        El contenido se escribe en un temporal y os.link lo publica con el
+        nombre final. A diferencia de os.replace, link falla si el destino ya
+        existe (por ejemplo, porque otro proceso creó ese cliente después de
+        listar el directorio), y el archivo final aparece completo o no
+        aparece.
+        
+        Args:
+            clave: Nombre normalizado del cliente
+            contenido: Contenido del archivo ya codificado
+            
+        Raises:
+            FileExistsError: Si ya existe un archivo para ese cliente
+            OSError: Si falla la escritura
+        """
+        ruta_archivo = f"{self._prefijo_rutas}{clave}.txt"
+        ruta_temporal = f"{self._prefijo_rutas}.{clave}.txt.tmp"
+        
+        try:
+            with open(ruta_temporal, 'wb') as archivo:
+                archivo.write(contenido)
+                if self.escritura_durable:
+                    archivo.flush()
+                    os.fsync(archivo.fileno())
+            
+            try:
+                os.link(ruta_temporal, ruta_archivo)
+            except FileExistsError:
+                raise
+            except OSError:
+                # Sistema de archivos sin enlaces duros: se reserva el nombre
+                # con O_EXCL y después el temporal lo reemplaza
+                os.close(os.open(ruta_archivo, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                os.replace(ruta_temporal, ruta_archivo)
+        finally:
+            # Tras link el temporal sobra; tras un error no debe quedar a medias
+            try:
+                os.unlink(ruta_temporal)
+            except OSError:
+                pass
+    
+    def _anexar_servicio_en_archivo(self, cliente: Cliente, servicio: Servicio):
+        """
+        Agrega la línea de un servicio nuevo al final del archivo del cliente.
+        
+        Los servicios son la última sección del formato, así que basta con
+        escribir la línea nueva en modo append: el costo depende del tamaño
+        del servicio y no del historial completo del cliente. Si el archivo
+        ya no existe (lo borraron fuera del programa) se vuelve a escribir
+        completo con _guardar_cliente_en_archivo.
+        
+        Args:
+            cliente: Cliente al que pertenece el servicio
+            servicio: Servicio recién agregado a cliente.servicios
+            
+        Raises:
+            ErrorArchivo: Si hay problemas al escribir el archivo
+        """
+        ruta_archivo = self._obtener_ruta_archivo(cliente.nombre_normalizado)
+        # Sin O_CREAT: un archivo que falta no debe quedar solo con esta línea
+        banderas = os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        
+        try:
+            fd = os.open(ruta_archivo, banderas)
+        except FileNotFoundError:
+            self._guardar_cliente_en_archivo(cliente)
+            return
+        except OSError as e:
+            raise ErrorArchivo(operacion="escribir", nombre_archivo=ruta_archivo, motivo=str(e))
+        
+        try:
+            # El archivo no termina en salto de línea, por eso va al inicio
+            datos = memoryview(f"\n- {servicio}".encode('utf-8'))
+            while datos:
+                datos = datos[os.write(fd, datos):]
+            if self.escritura_durable:
+                os.fsync(fd)
+        except OSError as e:
+            raise ErrorArchivo(operacion="escribir", nombre_archivo=ruta_archivo, motivo=str(e))
+        finally:
+            os.close(fd)
+    
     def _eliminar_archivo_cliente(self, nombre_normalizado: str):
         """
         Elimina el archivo de un cliente del disco.
@@ -173,13 +563,14 @@ class ClienteManager:
         ruta_archivo = self._obtener_ruta_archivo(nombre_normalizado)
         
         try:
-            if ruta_archivo.exists():
-                ruta_archivo.unlink()
-            
+            os.unlink(ruta_archivo)
+        except FileNotFoundError:
+            # Ya no existía: no hay nada que eliminar
+            pass
         except Exception as e:
             raise ErrorArchivo(
                 operacion="eliminar",
-                nombre_archivo=str(ruta_archivo),
+                nombre_archivo=ruta_archivo,
                 motivo=str(e)
             )
     
@@ -188,28 +579,74 @@ class ClienteManager:
         Carga todos los archivos de clientes en la tabla hash.
         
         Esta función es importante para el rendimiento:
-        - Lee todos los archivos .txt del directorio
+        - Recorre el índice de archivos construido al iniciar
+        - Los lee en paralelo con varios hilos (la lectura de archivos
+          libera el GIL, así que los hilos sí se solapan); si son pocos,
+          los lee en el hilo actual para no pagar la creación de hilos
         - Los carga en la tabla hash para acceso O(1)
         - Solo carga clientes que no estén ya en caché
+        - Si la caché ya está completa y el directorio no cambió (mismo
+          mtime), termina sin recorrer el índice
         """
-        if not self.directorio_datos.exists():
+        mtime_directorio = self._leer_mtime_directorio()
+        if mtime_directorio != self._mtime_directorio:
+            # Hubo archivos creados o borrados (por esta sesión o por fuera)
+            self._sincronizar_indice(mtime_directorio)
+        elif self._cache_completo:
             return
         
-        # Buscar todos los archivos .txt en el directorio
-        archivos_clientes = list(self.directorio_datos.glob("*.txt"))
+        # Solo cargar los que no están ya en caché
+        pendientes = [
+            nombre_normalizado for nombre_normalizado in self._indice_archivos
+            if nombre_normalizado not in self._cache_clientes
+        ]
+        if not pendientes:
+            self._cache_completo = True
+            return
+        
+        # Se vuelve a leer el disco: las búsquedas fallidas anteriores caducan
+        self._claves_inexistentes.clear()
+        
+        if len(pendientes) < _MINIMO_ARCHIVOS_EN_PARALELO:
+            resultados = [self._leer_cliente_para_cache(nombre) for nombre in pendientes]
+        else:
+            max_hilos = min(32, (os.cpu_count() or 1) * 4, len(pendientes))
+            with ThreadPoolExecutor(max_workers=max_hilos) as ejecutor:
+                resultados = list(ejecutor.map(self._leer_cliente_para_cache, pendientes))
+        
+        # Los hilos solo leen; la tabla hash se actualiza aquí, en el hilo principal
+        cargados = {}
+        for nombre_normalizado, cliente, error in resultados:
+            if cliente is not None:
+                cargados[nombre_normalizado] = cliente
+            else:
+                # Si hay un archivo corrupto, simplemente lo omitimos
+                archivo = self._indice_archivos[nombre_normalizado]
+                logger.warning("⚠️  Advertencia: No se pudo cargar %s: %s", archivo, error)
+        
+        self._agregar_a_cache(cargados)
         
-        for archivo in archivos_clientes:
-            # Obtener nombre normalizado del archivo
-            nombre_normalizado = archivo.stem
+        # Los archivos corruptos también cuentan como intentados: no se
+        # vuelven a leer hasta que el directorio cambie
+        self._cache_completo = True
+    
+    def _leer_cliente_para_cache(self, nombre_normalizado: str):
+        """
+        Lee un cliente desde disco sin tocar la tabla hash (se ejecuta en un hilo).
+        
+        Args:
+            nombre_normalizado: Nombre normalizado del cliente
             
-            # Solo cargar si no está ya en caché
-            if nombre_normalizado not in self._cache_clientes:
-                try:
-                    cliente = self._cargar_cliente_desde_archivo(nombre_normalizado)
-                    self._cache_clientes[nombre_normalizado] = cliente
-                except Exception as e:
-                    # Si hay un archivo corrupto, simplemente lo omitimos
-                    print(f"⚠️  Advertencia: No se pudo cargar {archivo}: {e}")
+        Returns:
+            Tupla (nombre_normalizado, cliente o None, error o None)
+        """
+        try:
+            # La ruta viene del índice (listado del directorio): se lee
+            # directamente, sin exists() ni construir otra ruta
+            ruta_archivo = self._indice_archivos[nombre_normalizado]
+            return nombre_normalizado, self._cargar_cliente_desde_bytes(ruta_archivo), None
+        except Exception as e:
+            return nombre_normalizado, None, e
     
     def crear_cliente(self, nombre: str, telefono: str, email: str, primer_servicio: str) -> Cliente:
         """
@@ -237,15 +674,26 @@ class ClienteManager:
         # Crear el objeto cliente (esto valida los datos automáticamente)
         cliente = Cliente(nombre=nombre, telefono=telefono, email=email)
         
+        # Clave de la tabla hash, internada como las demás claves
+        clave = sys.intern(cliente.nombre_normalizado)
+        
         # Verificar si ya existe un cliente con este nombre
         # Esto es una búsqueda O(1) en la tabla hash
-        if cliente.nombre_normalizado in self._cache_clientes:
+        if clave in self._cache_clientes:
             raise ClienteExisteError(cliente.nombre)
         
-        # Verificar si existe archivo en disco (por si no está en caché)
-        ruta_archivo = self._obtener_ruta_archivo(cliente.nombre_normalizado)
-        if ruta_archivo.exists():
-            raise ClienteExisteError(cliente.nombre)
+        # Verificar si existe archivo en disco (por si no está en caché).
+        # El índice es solo un atajo en memoria: puede no ver archivos creados
+        # por otro proceso, así que la comprobación definitiva la hace
+        # _crear_archivo_nuevo al publicar el archivo
+        if clave in self._indice_archivos:
+            if os.path.exists(self._indice_archivos[clave]):
+                raise ClienteExisteError(cliente.nombre)
+            # Entrada obsoleta: el archivo se borró por fuera de esta sesión
+            del self._indice_archivos[clave]
+            self._trie_nombres.eliminar(clave)
+            self._estadisticas_sucias = True
+        ruta_archivo = self._obtener_ruta_archivo(clave)
         
         # Generar ID único del cliente
         cliente.id_cliente = cliente.generar_id_cliente()
@@ -253,17 +701,100 @@ class ClienteManager:
         # Agregar el primer servicio
         cliente.agregar_servicio(primer_servicio)
         
-        # Guardar en archivo
-        self._guardar_cliente_en_archivo(cliente)
+        # Guardar en archivo, sin reemplazar uno que ya exista en disco
+        try:
+            self._crear_archivo_nuevo(clave, cliente.a_formato_archivo().encode('utf-8'))
+        except FileExistsError:
+            raise ClienteExisteError(cliente.nombre)
+        except OSError as e:
+            raise ErrorArchivo(operacion="escribir", nombre_archivo=ruta_archivo, motivo=str(e))
         
-        # Agregar a la tabla hash (caché en memoria)
-        self._cache_clientes[cliente.nombre_normalizado] = cliente
+        # Agregar a la tabla hash (caché en memoria) y al índice de archivos
+        self._agregar_a_cache({clave: cliente})
+        self._indice_archivos[clave] = ruta_archivo
+        self._trie_nombres.insertar(clave)
+        self._claves_inexistentes.discard(clave)
+        self._estadisticas_sucias = True
         
-        print(f"✅ Cliente guardado en tabla hash: clave='{cliente.nombre_normalizado}'")
+        logger.debug("✅ Cliente guardado en tabla hash: clave='%s'", clave)
         
         return cliente
     
-    def obtener_cliente(self, nombre: str) -> Cliente:
+    def crear_clientes_lote(
+        self, registros: Iterable[Tuple[str, str, str, str]]
+    ) -> Tuple[List[Cliente], List[Tuple[str, Exception]]]:
+        """
+        Crea varios clientes de una sola vez (por ejemplo, al importar datos).
+        
+        Equivale a llamar a crear_cliente() con cada registro, pero:
+        - Primero valida todos los registros en memoria y descarta duplicados
+        - Luego escribe los archivos en un ciclo corto, cada uno de forma
+          atómica y sin pisar archivos que ya existan en disco
+        - Al final actualiza la tabla hash con un solo update()
+        
+        Un registro con errores no detiene el lote: se reporta en la lista
+        de fallidos y se sigue con los demás.
+        
+        Args:
+            registros: Tuplas (nombre, telefono, email, primer_servicio)
+            
+        Returns:
+            Tupla (clientes creados, lista de (nombre, error) de los que fallaron)
+        """
+        fallidos: List[Tuple[str, Exception]] = []
+        
+        # 1. Validar en memoria: datos, duplicados en la tabla hash, en el
+        #    índice de archivos y dentro del mismo lote
+        pendientes: Dict[str, Cliente] = {}
+        for nombre, telefono, email, primer_servicio in registros:
+            try:
+                cliente = Cliente(nombre=nombre, telefono=telefono, email=email)
+                clave = sys.intern(cliente.nombre_normalizado)
+                if (clave in self._cache_clientes or clave in self._indice_archivos
+                        or clave in pendientes):
+                    raise ClienteExisteError(cliente.nombre)
+                cliente.id_cliente = cliente.generar_id_cliente()
+                cliente.agregar_servicio(primer_servicio)
+            except ClienteError as e:
+                fallidos.append((nombre, e))
+                continue
+            pendientes[clave] = cliente
+        
+        # 2. Escribir los archivos con el mismo mecanismo que crear_cliente:
+        #    temporal + os.link, que falla si el archivo ya existe en disco y
+        #    nunca deja un archivo de cliente a medias
+        creados: Dict[str, Cliente] = {}
+        for clave, cliente in pendientes.items():
+            try:
+                self._crear_archivo_nuevo(clave, cliente.a_formato_archivo().encode('utf-8'))
+            except FileExistsError:
+                fallidos.append((cliente.nombre, ClienteExisteError(cliente.nombre)))
+                continue
+            except OSError as e:
+                fallidos.append((cliente.nombre, ErrorArchivo(
+                    operacion="escribir",
+                    nombre_archivo=self._obtener_ruta_archivo(clave),
+                    motivo=str(e)
+                )))
+                continue
+            creados[clave] = cliente
+        
+        # 3. Actualizar tabla hash, índice y árbol de una sola vez
+        self._agregar_a_cache(creados)
+        self._indice_archivos.update(
+            (clave, self._obtener_ruta_archivo(clave)) for clave in creados
+        )
+        for clave in creados:
+            self._trie_nombres.insertar(clave)
+        self._claves_inexistentes.difference_update(creados)
+        if creados:
+            self._estadisticas_sucias = True
+        
+        logger.debug("✅ Lote procesado: %d creados, %d con errores", len(creados), len(fallidos))
+        
+        return list(creados.values()), fallidos
+    
+    def obtener_cliente(self, nombre: str, ya_normalizado: bool = False) -> Cliente:
         """
         Busca un cliente por su nombre utilizando la tabla hash.
         
@@ -273,6 +804,7 @@ class ClienteManager:
         
         Args:
             nombre: Nombre del cliente a buscar
+            ya_normalizado: True si nombre ya es la clave normalizada
             
         Returns:
             Objeto Cliente encontrado
@@ -281,26 +813,44 @@ class ClienteManager:
             ClienteNoEncontradoError: Si el cliente no existe
         """
         # Normalizar el nombre para usarlo como clave en la tabla hash
-        cliente_temp = Cliente(nombre=nombre, telefono="0000000000", email="temp@temp.com")
-        nombre_normalizado = cliente_temp.nombre_normalizado
+        # (se omite si quien llama ya lo normalizó)
+        if ya_normalizado:
+            nombre_normalizado = nombre
+        else:
+            nombre_normalizado = self.normalizar_nombre(nombre)
         
-        # BÚSQUEDA O(1) EN LA TABLA HASH
-        if nombre_normalizado in self._cache_clientes:
-            print(f"🎯 Cliente encontrado en tabla hash (O(1)): '{nombre_normalizado}'")
-            return self._cache_clientes[nombre_normalizado]
+        # BÚSQUEDA O(1) EN LA TABLA HASH (un solo get() en lugar de in + [])
+        cliente = self._cache_clientes.get(nombre_normalizado)
+        if cliente is not None:
+            logger.debug("🎯 Cliente encontrado en tabla hash (O(1)): '%s'", nombre_normalizado)
+            return cliente
+        
+        # Ya se buscó en disco sin éxito: no repetir la consulta mientras
+        # el directorio no cambie (un solo stat() en lugar de abrir el archivo)
+        if nombre_normalizado in self._claves_inexistentes:
+            mtime_directorio = self._leer_mtime_directorio()
+            if mtime_directorio == self._mtime_directorio:
+                raise ClienteNoEncontradoError(nombre)
+            self._sincronizar_indice(mtime_directorio)
         
         # Si no está en caché, intentar cargar desde archivo
         try:
             cliente = self._cargar_cliente_desde_archivo(nombre_normalizado)
             
             # Agregar al caché para futuras búsquedas O(1)
-            self._cache_clientes[nombre_normalizado] = cliente
+            self._agregar_a_cache({nombre_normalizado: cliente})
+            if nombre_normalizado not in self._indice_archivos:
+                # Archivo creado fuera de esta sesión: cambia el total de clientes
+                self._indice_archivos[nombre_normalizado] = self._obtener_ruta_archivo(nombre_normalizado)
+                self._trie_nombres.insertar(nombre_normalizado)
+                self._estadisticas_sucias = True
             
-            print(f"📂 Cliente cargado desde archivo y agregado a tabla hash")
+            logger.debug("📂 Cliente cargado desde archivo y agregado a tabla hash")
             return cliente
             
         except ClienteNoEncontradoError:
-            # Re-lanzar la excepción con el nombre original
+            # Recordar la clave inexistente y re-lanzar con el nombre original
+            self._claves_inexistentes.add(nombre_normalizado)
             raise ClienteNoEncontradoError(nombre)
     
     def listar_todos_clientes(self) -> List[Cliente]:
@@ -318,23 +868,27 @@ class ClienteManager:
         # Cargar todos los clientes en la tabla hash
         self._cargar_todos_clientes_a_cache()
         
-        # Retornar lista de valores del diccionario
-        clientes = list(self._cache_clientes.values())
-        
-        # Ordenar por nombre para presentación consistente
-        clientes.sort(key=lambda c: c.nombre)
+        # Ordenar por nombre para presentación consistente: se ordenan las
+        # posiciones comparando la columna de nombres (solo cadenas) y luego
+        # se toman los clientes de la tabla hash en ese orden
+        claves, nombres = self._claves, self._nombres
+        orden = sorted(range(len(nombres)), key=nombres.__getitem__)
+        cache = self._cache_clientes
+        clientes = [cache[claves[posicion]] for posicion in orden]
         
-        print(f"📊 Clientes en tabla hash: {len(self._cache_clientes)}")
+        logger.debug("📊 Clientes en tabla hash: %d", len(self._cache_clientes))
         
         return clientes
     
-    def agregar_servicio_cliente(self, nombre: str, descripcion_servicio: str) -> Cliente:
+    def agregar_servicio_cliente(self, nombre: str, descripcion_servicio: str,
+                                 ya_normalizado: bool = False) -> Cliente:
         """
         Agrega un servicio a un cliente existente.
         
         Args:
             nombre: Nombre del cliente
             descripcion_servicio: Descripción del nuevo servicio
+            ya_normalizado: True si nombre ya es la clave normalizada
             
         Returns:
             Cliente actualizado con el nuevo servicio
@@ -343,20 +897,22 @@ class ClienteManager:
             ClienteNoEncontradoError: Si el cliente no existe
         """
         # Buscar el cliente (búsqueda O(1))
-        cliente = self.obtener_cliente(nombre)
+        cliente = self.obtener_cliente(nombre, ya_normalizado)
         
         # Agregar el nuevo servicio
         cliente.agregar_servicio(descripcion_servicio)
         
-        # Guardar cambios en archivo
-        self._guardar_cliente_en_archivo(cliente)
+        # Guardar cambios en archivo: solo se anexa la línea del servicio
+        # nuevo, sin reescribir el archivo completo
+        self._anexar_servicio_en_archivo(cliente, cliente.servicios[-1])
         
-        # Actualizar en tabla hash (aunque ya debería estar actualizado por referencia)
-        self._cache_clientes[cliente.nombre_normalizado] = cliente
+        # El objeto de la tabla hash es el mismo que se acaba de modificar
+        self._total_servicios += 1
+        self._estadisticas_sucias = True
         
         return cliente
     
-    def eliminar_cliente(self, nombre: str) -> bool:
+    def eliminar_cliente(self, nombre: str, ya_normalizado: bool = False) -> bool:
         """
         Elimina un cliente del sistema.
         
@@ -367,6 +923,7 @@ class ClienteManager:
         
         Args:
             nombre: Nombre del cliente a eliminar
+            ya_normalizado: True si nombre ya es la clave normalizada
             
         Returns:
             True si se eliminó correctamente
@@ -375,49 +932,99 @@ class ClienteManager:
             ClienteNoEncontradoError: Si el cliente no existe
         """
         # Verificar que el cliente existe (búsqueda O(1))
-        cliente = self.obtener_cliente(nombre)
+        cliente = self.obtener_cliente(nombre, ya_normalizado)
         
         # Eliminar archivo del disco
         self._eliminar_archivo_cliente(cliente.nombre_normalizado)
         
-        # Eliminar de la tabla hash
-        if cliente.nombre_normalizado in self._cache_clientes:
-            del self._cache_clientes[cliente.nombre_normalizado]
+        # Eliminar de la tabla hash y del índice de archivos
+        self._quitar_de_cache(cliente.nombre_normalizado)
+        self._indice_archivos.pop(cliente.nombre_normalizado, None)
+        self._trie_nombres.eliminar(cliente.nombre_normalizado)
+        self._estadisticas_sucias = True
         
-        print(f"🗑️  Cliente eliminado de tabla hash: '{cliente.nombre_normalizado}'")
+        logger.debug("🗑️  Cliente eliminado de tabla hash: '%s'", cliente.nombre_normalizado)
         
         return True
     
+    def sugerir_nombres(self, nombre: str, limite: int = 3,
+                        ya_normalizado: bool = False) -> List[str]:
+        """
+        Sugiere clientes cuyo nombre normalizado empieza igual que 'nombre'.
+        
+        Se usa cuando una búsqueda falla, para ofrecer nombres parecidos.
+        Compara los primeros 4 caracteres usando el árbol de prefijos, sin
+        recorrer todos los clientes.
+        
+        Args:
+            nombre: Nombre buscado
+            limite: Número máximo de sugerencias
+            ya_normalizado: True si nombre ya es la clave normalizada
+            
+        Returns:
+            Lista de nombres normalizados sugeridos (puede estar vacía)
+        """
+        clave = nombre if ya_normalizado else self.normalizar_nombre(nombre)
+        return self._trie_nombres.con_prefijo(clave[:4], limite)
+    
+    def contar_clientes(self) -> int:
+        """
+        Cuenta los clientes registrados sin leer sus archivos.
+        
+        Returns:
+            Número de clientes en el índice de archivos
+        """
+        return len(self._indice_archivos)
+    
     def obtener_estadisticas(self) -> Dict[str, Union[int, float]]:
         """
         Calcula y retorna estadísticas del sistema.
         
+        El resultado se memoriza y solo se recalcula después de crear,
+        modificar o eliminar un cliente, o cuando cambia el directorio de
+        datos (misma comprobación de mtime que _cargar_todos_clientes_a_cache).
+        
         Returns:
-            Diccionario con estadísticas del sistema
+            Diccionario con estadísticas del sistema (una copia: modificarlo
+            no altera el valor memorizado)
         """
-        # Cargar todos los clientes para tener datos completos
-        self._cargar_todos_clientes_a_cache()
+        # Archivos creados o borrados por fuera invalidan el valor memorizado
+        mtime_directorio = self._leer_mtime_directorio()
+        if mtime_directorio != self._mtime_directorio:
+            self._sincronizar_indice(mtime_directorio)
         
-        total_clientes = len(self._cache_clientes)
+        if not self._estadisticas_sucias and self._estadisticas_cache is not None:
+            return dict(self._estadisticas_cache)
+        
+        # Los servicios requieren tener todos los clientes en la tabla hash
+        # (no hace nada si la caché ya está completa y el directorio no
+        # cambió); la carga también pone al día el índice, así que el total
+        # de clientes se cuenta después
+        self._cargar_todos_clientes_a_cache()
+        total_clientes = self.contar_clientes()
         
         if total_clientes == 0:
-            return {
+            estadisticas = {
                 "total_clientes": 0,
                 "total_servicios": 0,
                 "promedio_servicios": 0.0
             }
+        else:
+            # Contador mantenido en cada cambio: no hay que recorrer los clientes
+            total_servicios = self._total_servicios
+            
+            # Calcular promedio
+            promedio_servicios = total_servicios / total_clientes
+            
+            estadisticas = {
+                "total_clientes": total_clientes,
+                "total_servicios": total_servicios,
+                "promedio_servicios": promedio_servicios
+            }
         
-        # Contar servicios totales
-        total_servicios = sum(len(cliente.servicios) for cliente in self._cache_clientes.values())
-        
-        # Calcular promedio
-        promedio_servicios = total_servicios / total_clientes if total_clientes > 0 else 0
-        
-        return {
-            "total_clientes": total_clientes,
-            "total_servicios": total_servicios,
-            "promedio_servicios": promedio_servicios
-        }
+        self._estadisticas_cache = estadisticas
+        self._estadisticas_sucias = False
+        return dict(estadisticas)
     
     def __str__(self):
         """Representación en texto del gestor."""
@@ -442,15 +1049,5 @@ def normalizar_nombre(nombre: str) -> str:
     Returns:
         Nombre normalizado
     """
-    import re
-    
-    # Crear un cliente temporal solo para usar su método de normalización
-    try:
-        cliente_temp = Cliente(nombre=nombre, telefono="0000000000", email="temp@temp.com")
-        return cliente_temp.nombre_normalizado
-    except ErrorValidacion:
-        # Si el nombre no es válido para un cliente, hacer normalización básica
-        normalizado = nombre.lower().strip()
-        normalizado = normalizado.replace(' ', '_')
-        normalizado = re.sub(r'[^a-z0-9_]', '', normalizado)
-        return normalizado
\ No newline at end of file
+    # Función pura compartida con Cliente: sin Cliente temporal ni validaciones
+    return normalizar_clave(nombre)
@@ -28,9 +28,10 @@ Design Patterns Used:
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 
@@ -40,10 +41,13 @@ class DatabaseConfig:
     base_directory: str = "axanet_clients_data"
     file_extension: str = ".txt"
     encoding: str = "utf-8"
+    io_buffer_size: int = 65536  # open() buffer; CPython's default is only 8 KiB
+    cache_directory: str = "~/.cache/axanet"  # loaded-client snapshots; empty disables them
+    durable_writes: bool = False  # fsync every client file write (safe across power loss, slower)
     
-    @property
+    @cached_property
     def full_path(self) -> Path:
-        """Get the full path to the data directory."""
+        """Get the full path to the data directory (resolved once, then cached)."""
         return Path(self.base_directory).resolve()
 
 
@@ -56,6 +60,7 @@ class LoggingConfig:
     date_format: str = "%Y-%m-%d %H:%M:%S"
     max_file_size_mb: int = 10
     backup_count: int = 5
+    buffer_records: int = 100
     
     @property
     def log_level(self) -> int:
@@ -71,9 +76,10 @@ class AppConfig:
     debug: bool = False
     environment: str = "development"
     
-    # Component configurations
-    database: DatabaseConfig = DatabaseConfig()
-    logging: LoggingConfig = LoggingConfig()
+    # Component configurations; default_factory gives every AppConfig its
+    # own instances instead of sharing one mutable default between them
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
 
 
 class ConfigManager:
@@ -88,10 +94,13 @@ class ConfigManager:
         - Environment variables allow secure deployment without code changes
         - Configuration validation prevents common deployment issues
         - Type conversion ensures proper data types for settings
+        - The configuration and the derived data directory are computed once
+          and stored as plain attributes, so hot helpers such as
+          get_client_file_path() do no re-checking or path resolution
     """
     
     _instance: Optional['ConfigManager'] = None
-    _config: Optional[AppConfig] = None
+    config: Optional[AppConfig] = None
     
     def __new__(cls) -> 'ConfigManager':
         """Implement singleton pattern."""
@@ -100,9 +109,15 @@ class ConfigManager:
         return cls._instance
     
     def __init__(self):
-        """Initialize configuration manager."""
-        if self._config is None:
-            self._config = self._load_config()
+        """Initialize configuration manager (only on the first instantiation)."""
+        if self.config is None:
+            self._apply_config(self._load_config())
+    
+    def _apply_config(self, config: AppConfig) -> None:
+        """Store a loaded configuration and the values derived from it."""
+        self.config = config
+        self._data_directory = config.database.full_path
+        self._file_extension = config.database.file_extension
     
     def _load_config(self) -> AppConfig:
         """
@@ -124,7 +139,10 @@ class ConfigManager:
         db_config = DatabaseConfig(
             base_directory=os.getenv("AXANET_DATA_DIR", "axanet_clients_data"),
             file_extension=os.getenv("AXANET_FILE_EXT", ".txt"),
-            encoding=os.getenv("AXANET_ENCODING", "utf-8")
+            encoding=os.getenv("AXANET_ENCODING", "utf-8"),
+            io_buffer_size=self._get_int_env("AXANET_IO_BUFFER_SIZE", 65536),
+            cache_directory=os.getenv("AXANET_CACHE_DIR", "~/.cache/axanet"),
+            durable_writes=self._get_bool_env("AXANET_DURABLE_WRITES", False)
         )
         
         # Logging configuration  
@@ -132,7 +150,8 @@ class ConfigManager:
             level=os.getenv("AXANET_LOG_LEVEL", "INFO"),
             file_name=os.getenv("AXANET_LOG_FILE", "axanet_client_manager.log"),
             max_file_size_mb=self._get_int_env("AXANET_LOG_MAX_SIZE_MB", 10),
-            backup_count=self._get_int_env("AXANET_LOG_BACKUP_COUNT", 5)
+            backup_count=self._get_int_env("AXANET_LOG_BACKUP_COUNT", 5),
+            buffer_records=self._get_int_env("AXANET_LOG_BUFFER_RECORDS", 100)
         )
         
         # Main application configuration
@@ -193,22 +212,21 @@ class ConfigManager:
             raise ValueError("File extension must start with a dot")
         
         # Validate numeric values
+        if config.database.io_buffer_size <= 0:
+            raise ValueError("I/O buffer size must be positive")
+        
         if config.logging.max_file_size_mb <= 0:
             raise ValueError("Log file max size must be positive")
         
         if config.logging.backup_count < 0:
             raise ValueError("Log backup count cannot be negative")
-    
-    @property
-    def config(self) -> AppConfig:
-        """Get the current configuration."""
-        if self._config is None:
-            self._config = self._load_config()
-        return self._config
+        
+        if config.logging.buffer_records < 0:
+            raise ValueError("Log buffer size cannot be negative")
     
     def get_data_directory(self) -> Path:
         """Get the full path to the data directory."""
-        return self.config.database.full_path
+        return self._data_directory
     
     def ensure_data_directory(self) -> None:
         """Ensure the data directory exists."""
@@ -225,12 +243,11 @@ class ConfigManager:
         Returns:
             Path: Full path to client file
         """
-        filename = f"{normalized_name}{self.config.database.file_extension}"
-        return self.get_data_directory() / filename
+        return self._data_directory / f"{normalized_name}{self._file_extension}"
     
     def reload_config(self) -> None:
         """Reload configuration from environment variables."""
-        self._config = self._load_config()
+        self._apply_config(self._load_config())
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -252,13 +269,17 @@ class ConfigManager:
                 "base_directory": self.config.database.base_directory,
                 "file_extension": self.config.database.file_extension,
                 "encoding": self.config.database.encoding,
+                "io_buffer_size": self.config.database.io_buffer_size,
+                "cache_directory": self.config.database.cache_directory,
+                "durable_writes": self.config.database.durable_writes,
                 "full_path": str(self.config.database.full_path)
             },
             "logging": {
                 "level": self.config.logging.level,
                 "file_name": self.config.logging.file_name,
                 "max_file_size_mb": self.config.logging.max_file_size_mb,
-                "backup_count": self.config.logging.backup_count
+                "backup_count": self.config.logging.backup_count,
+                "buffer_records": self.config.logging.buffer_records
             }
         }
 
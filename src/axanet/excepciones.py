@@ -22,7 +22,7 @@ class ClienteError(Exception):
     Permite capturar cualquier error relacionado con clientes de manera general.
     """
     
-    def __init__(self, mensaje: str, nombre_cliente: str):
+    def __init__(self, mensaje: str, nombre_cliente: str = ""):
         """
         Inicializa la excepción con un mensaje y opcionalmente el nombre del cliente.
         
@@ -86,16 +86,18 @@ class ErrorValidacion(ClienteError):
     - Email sin formato válido
     """
     
-    def __init__(self, campo: str, motivo: str):
+    def __init__(self, campo: str, motivo: str, valor: str = ""):
         """
         Inicializa el error de validación.
         
         Args:
             campo: Nombre del campo que falló la validación
             motivo: Descripción específica del error
+            valor: Valor que no pasó la validación (opcional)
         """
         self.campo = campo
         self.motivo = motivo
+        self.valor = valor
         super().__init__(f"Error de validación en {campo}: {motivo}")
 
 
@@ -13,13 +13,96 @@ Las clases son simples pero demuestran conceptos importantes:
 - Manejo de fechas y timestamps
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 import re
+import time
 
 from .excepciones import ErrorValidacion
 
 
+# Tabla de traducción construida una sola vez: quita acentos y cambia
+# espacios por guiones bajos en una sola pasada con str.translate
+_TABLA_NORMALIZACION = str.maketrans({
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+    'ñ': 'n', 'ç': 'c', ' ': '_'
+})
+
+# Caracteres que no pueden formar parte de una clave normalizada
+_RE_CARACTERES_INVALIDOS = re.compile(r'[^a-z0-9_]')
+
+# Patrones de validación, compilados una sola vez al importar el módulo
+_RE_NO_DIGITOS = re.compile(r'[^\d]')
+_RE_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+def normalizar_clave(nombre: str) -> str:
+    """
+    Convierte un nombre en la clave de la tabla hash y del archivo del cliente.
+    
+    Es una función pura: no crea un Cliente ni ejecuta validaciones, así que
+    la usan tanto Cliente.nombre_normalizado como las búsquedas del gestor.
+    
+    Args:
+        nombre: Nombre del cliente
+        
+    Returns:
+        Nombre normalizado (ej: "Ana García" → "ana_garcia")
+    """
+    return _RE_CARACTERES_INVALIDOS.sub('', nombre.strip().lower().translate(_TABLA_NORMALIZACION))
+
+
+# Etiquetas de los campos de una línea "Etiqueta: valor" del archivo de cliente
+_CAMPOS_ARCHIVO = ("Nombre", "ID_Cliente", "Telefono", "Correo", "FechaRegistro")
+
+
+# Caché de la fecha del día: [instante en que deja de ser válida, texto "YYYY-MM-DD"]
+_cache_fecha_hoy = [0.0, ""]
+
+
+def _fecha_hoy() -> str:
+    """
+    Devuelve la fecha actual como texto "YYYY-MM-DD".
+    
+    El texto solo cambia una vez al día, así que se calcula con strftime
+    una sola vez y se reutiliza hasta la siguiente medianoche.
+    
+    Returns:
+        Fecha actual en formato "YYYY-MM-DD"
+    """
+    if time.time() >= _cache_fecha_hoy[0]:
+        ahora = datetime.now()
+        medianoche = (ahora + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        _cache_fecha_hoy[0] = medianoche.timestamp()
+        _cache_fecha_hoy[1] = ahora.strftime("%Y-%m-%d")
+    return _cache_fecha_hoy[1]
+
+
+# Caché del segundo actual: [segundo desde epoch, "YYYYMMDDHHMMSS", "YYYY-MM-DD HH:MM:SS"]
+_cache_segundo = [-1, "", ""]
+
+
+def _marcas_de_tiempo():
+    """
+    Devuelve el instante actual (con resolución de segundos) en los dos
+    formatos de texto que usan los modelos.
+    
+    Crear un cliente pide la hora dos veces (ID y primer servicio); ambas
+    caen casi siempre en el mismo segundo, así que el formateo se hace una
+    sola vez por segundo y las demás llamadas solo leen time.time().
+    
+    Returns:
+        Tupla (marca para IDs "YYYYMMDDHHMMSS", fecha y hora "YYYY-MM-DD HH:MM:SS")
+    """
+    segundo = int(time.time())
+    if segundo != _cache_segundo[0]:
+        local = time.localtime(segundo)
+        _cache_segundo[0] = segundo
+        _cache_segundo[1] = time.strftime("%Y%m%d%H%M%S", local)
+        _cache_segundo[2] = time.strftime("%Y-%m-%d %H:%M:%S", local)
+    return _cache_segundo[1], _cache_segundo[2]
+
+
 class Servicio:
     """
     Representa un servicio solicitado por un cliente.
@@ -29,6 +112,9 @@ class Servicio:
     - Fecha y hora cuando fue solicitado
     """
     
+    # __slots__: sin __dict__ por instancia, menos memoria y acceso directo
+    __slots__ = ("descripcion", "fecha_solicitud")
+    
     def __init__(self, descripcion: str, fecha_solicitud: str):
         """
         Crea un nuevo servicio.
@@ -43,9 +129,8 @@ class Servicio:
         if fecha_solicitud:
             self.fecha_solicitud = fecha_solicitud
         else:
-            # Crear timestamp en formato legible
-            ahora = datetime.now()
-            self.fecha_solicitud = ahora.strftime("%Y-%m-%d %H:%M:%S")
+            # Timestamp en formato legible (compartido dentro del mismo segundo)
+            self.fecha_solicitud = _marcas_de_tiempo()[1]
     
     def __str__(self):
         """Representación en texto del servicio."""
@@ -63,6 +148,12 @@ class Cliente:
     - Lista de servicios solicitados
     """
     
+    # __slots__: sin __dict__ por instancia, menos memoria y acceso directo
+    __slots__ = (
+        "nombre", "nombre_normalizado", "id_cliente", "telefono",
+        "email", "fecha_registro", "servicios"
+    )
+    
     def __init__(self, nombre: str, telefono: str, email: str):
         """
         Crea un nuevo cliente con validación de datos.
@@ -77,19 +168,21 @@ class Cliente:
         self.telefono = telefono.strip()
         self.email = email.strip()
         
+        # Clave para la tabla hash, calculada una sola vez al crear el cliente
+        self.nombre_normalizado = self._normalizar_nombre(self.nombre)
+        
         # Inicializar otros campos
         self.servicios: List[Servicio] = []
         self.id_cliente = ""  # Se genera después
         
-        # Generar fecha de registro
-        ahora = datetime.now()
-        self.fecha_registro = ahora.strftime("%Y-%m-%d")
+        # Generar fecha de registro (cacheada por día)
+        self.fecha_registro = _fecha_hoy()
         
         # Validar todos los datos
         self.validar_datos()
     
-    @property
-    def nombre_normalizado(self) -> str:
+    @staticmethod
+    def _normalizar_nombre(nombre: str) -> str:
         """
         Genera un nombre normalizado para usar como clave en la tabla hash.
         
@@ -99,25 +192,14 @@ class Cliente:
         - Crear claves consistentes para la tabla hash
         - Permitir búsquedas case-insensitive
         
+        Args:
+            nombre: Nombre del cliente (ya sin espacios al inicio o al final)
+        
         Returns:
             Nombre normalizado sin espacios ni caracteres especiales
         """
-        # Convertir a minúsculas y reemplazar espacios con guiones bajos
-        normalizado = self.nombre.lower()
-        
-        # Reemplazar caracteres especiales comunes
-        reemplazos = {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-            'ñ': 'n', 'ç': 'c', ' ': '_'
-        }
-        
-        for original, reemplazo in reemplazos.items():
-            normalizado = normalizado.replace(original, reemplazo)
-        
-        # Eliminar caracteres que no sean letras, números o guiones bajos
-        normalizado = re.sub(r'[^a-z0-9_]', '', normalizado)
-        
-        return normalizado
+        # Misma función que usa el gestor, así las claves siempre coinciden
+        return normalizar_clave(nombre)
     
     def validar_datos(self):
         """
@@ -140,7 +222,7 @@ class Cliente:
             )
         
         # Validar teléfono (debe tener 10 dígitos)
-        telefono_limpio = re.sub(r'[^\d]', '', self.telefono)
+        telefono_limpio = _RE_NO_DIGITOS.sub('', self.telefono)
         if len(telefono_limpio) != 10:
             raise ErrorValidacion(
                 campo="telefono",
@@ -151,9 +233,12 @@ class Cliente:
         # Actualizar teléfono con formato limpio
         self.telefono = telefono_limpio
         
-        # Validar email con expresión regular simple
-        patron_email = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(patron_email, self.email):
+        # Validar email con expresión regular simple. Antes, un filtro barato:
+        # sin "@" o sin "." después de ella el email no puede ser válido y
+        # se rechaza sin ejecutar la expresión regular
+        email = self.email
+        arroba = email.find('@')
+        if arroba < 1 or '.' not in email[arroba + 1:] or not _RE_EMAIL.match(email):
             raise ErrorValidacion(
                 campo="email",
                 valor=self.email,
@@ -182,8 +267,8 @@ class Cliente:
         if len(iniciales) < 2:
             iniciales = (iniciales + self.nombre[:2].upper())[:2]
         
-        # Generar timestamp
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        # Generar timestamp (compartido dentro del mismo segundo)
+        timestamp = _marcas_de_tiempo()[0]
         
         # Combinar iniciales y timestamp
         id_cliente = f"{iniciales}_{timestamp}"
@@ -230,19 +315,20 @@ class Cliente:
         Returns:
             Contenido del archivo como string
         """
-        contenido = []
-        
-        # Información básica del cliente
-        contenido.append(f"Nombre: {self.nombre}")
-        contenido.append(f"ID_Cliente: {self.id_cliente}")
-        contenido.append(f"Telefono: {self.telefono}")
-        contenido.append(f"Correo: {self.email}")
-        contenido.append(f"FechaRegistro: {self.fecha_registro}")
-        
-        # Lista de servicios
-        contenido.append("Servicios:")
-        for servicio in self.servicios:
-            contenido.append(f"- {servicio.descripcion} ({servicio.fecha_solicitud})")
+        # Información básica del cliente, en una sola lista literal
+        contenido = [
+            f"Nombre: {self.nombre}",
+            f"ID_Cliente: {self.id_cliente}",
+            f"Telefono: {self.telefono}",
+            f"Correo: {self.email}",
+            f"FechaRegistro: {self.fecha_registro}",
+            "Servicios:",
+        ]
+        
+        # Lista de servicios: extend() con un generador, sin append por línea
+        contenido.extend(
+            f"- {servicio.descripcion} ({servicio.fecha_solicitud})" for servicio in self.servicios
+        )
         
         return "\n".join(contenido)
     
@@ -261,12 +347,8 @@ class Cliente:
         """
         lineas = contenido_archivo.strip().split('\n')
         
-        # Extraer información básica
-        nombre = ""
-        telefono = ""
-        email = ""
-        id_cliente = ""
-        fecha_registro = ""
+        # Extraer información básica: etiqueta → valor
+        campos = dict.fromkeys(_CAMPOS_ARCHIVO, "")
         
         servicios_seccion = False
         servicios_encontrados = []
@@ -274,16 +356,11 @@ class Cliente:
         for linea in lineas:
             linea = linea.strip()
             
-            if linea.startswith("Nombre:"):
-                nombre = linea.split(":", 1)[1].strip()
-            elif linea.startswith("ID_Cliente:"):
-                id_cliente = linea.split(":", 1)[1].strip()
-            elif linea.startswith("Telefono:"):
-                telefono = linea.split(":", 1)[1].strip()
-            elif linea.startswith("Correo:"):
-                email = linea.split(":", 1)[1].strip()
-            elif linea.startswith("FechaRegistro:"):
-                fecha_registro = linea.split(":", 1)[1].strip()
+            # Un solo partition() y una búsqueda en el diccionario por línea,
+            # en lugar de probar cada prefijo con startswith
+            etiqueta, separador, valor = linea.partition(":")
+            if separador and etiqueta in campos:
+                campos[etiqueta] = valor.strip()
             elif linea == "Servicios:":
                 servicios_seccion = True
             elif servicios_seccion and linea.startswith("- "):
@@ -305,11 +382,11 @@ class Cliente:
                     servicios_encontrados.append((servicio_texto, None))
         
         # Crear cliente con los datos básicos
-        cliente = cls(nombre=nombre, telefono=telefono, email=email)
+        cliente = cls(nombre=campos["Nombre"], telefono=campos["Telefono"], email=campos["Correo"])
         
         # Asignar campos que no se validan en __init__
-        cliente.id_cliente = id_cliente
-        cliente.fecha_registro = fecha_registro
+        cliente.id_cliente = campos["ID_Cliente"]
+        cliente.fecha_registro = campos["FechaRegistro"]
         
         # Agregar servicios
         for descripcion, fecha in servicios_encontrados:
@@ -29,12 +29,20 @@ Design Patterns Used:
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any
-from re import match
+from re import match, compile as re_compile
+from sys import intern
 import uuid
 
 from .exceptions import ValidationError
 
 
+# Compiled once at import time; normalize_name runs on every CRUD lookup
+_WHITESPACE_RE = re_compile(r"\s+")
+
+# Timestamp suffix used when generating client IDs
+_CLIENT_ID_TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+
+
 @dataclass
 class Service:
     """
@@ -95,7 +103,10 @@ class Client:
         - The client_id is automatically generated using UUID and timestamp
         - Services are stored as a list of Service objects
         - Validation ensures data integrity before saving
-        - The normalized_name property creates filesystem-safe filenames
+        - normalized_name is computed once in __post_init__ and then read as
+          a plain attribute, so file names and cache keys never repeat the
+          normalization; rename() is the way to change name and keep both
+          in step
     """
     name: str
     phone: str
@@ -103,9 +114,11 @@ class Client:
     services: List[Service] = field(default_factory=list)
     client_id: str = field(default="")
     registration_date: datetime = field(default_factory=datetime.now)
+    normalized_name: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Called after dataclass initialization to set computed fields."""
+        self.normalized_name = Client.normalize_name(self.name)
         if not self.client_id:
             self.client_id = self._generate_client_id()
     
@@ -120,29 +133,52 @@ class Client:
             This method combines business logic (initials) with technical
             requirements (uniqueness via timestamp) to create meaningful IDs.
         """
-        # Extract initials from client name
-        words = self.name.strip().split()
-        initials = "".join([word[0].upper() for word in words if word])
+        # Extract initials from client name (split() already strips and skips empty words)
+        initials = "".join(word[0] for word in self.name.split()).upper()
         
         # Add timestamp for uniqueness
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        timestamp = datetime.now().strftime(_CLIENT_ID_TIMESTAMP_FORMAT)
         
         return f"{initials}_{timestamp}"
     
-    @property
-    def normalized_name(self) -> str:
+    def rename(self, new_name: str) -> None:
         """
-        Get filesystem-safe version of client name.
+        Change the client's name, keeping normalized_name in step.
         
+        Args:
+            new_name (str): New client name
+        """
+        self.name = new_name
+        self.normalized_name = Client.normalize_name(new_name)
+    
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Get filesystem-safe version of a client name.
+        
+        Args:
+            name (str): Client name as typed
+            
         Returns:
             str: Normalized name suitable for filenames
             
         Educational Note:
-            This property converts spaces to underscores and makes lowercase
-            to ensure consistent file naming across different operating systems.
+            This converts spaces to underscores and makes lowercase to ensure
+            consistent file naming across different operating systems. Being a
+            static method, it also serves lookups by name without building a
+            throwaway Client. The result is interned, so the key stored in the
+            client cache and the key built for each lookup are the same object
+            and dict comparisons stop at the identity check.
         """
-        import re
-        return re.sub(r"\s+", "_", self.name.strip().lower())
+        normalized = name.strip().lower()
+        
+        # Fast path: single-word names have no whitespace to replace.
+        # isprintable() is False for every whitespace character except the
+        # ASCII space, so together both checks rule out any regex match.
+        if " " not in normalized and normalized.isprintable():
+            return intern(normalized)
+        
+        return intern(_WHITESPACE_RE.sub("_", normalized))
     
     def add_service(self, description: str) -> None:
         """
@@ -270,23 +306,21 @@ class Client:
             the requirements specification. It's designed to be both
             machine-parseable and human-readable.
         """
-        lines = [
-            f"Name: {self.name}",
-            f"Client_ID: {self.client_id}",
-            f"Phone: {self.phone}",
-            f"Email: {self.email}",
-            f"RegistrationDate: {self.registration_date.strftime('%Y-%m-%d')}",
-            "Services:"
-        ]
-        
-        # Add services
+        # Build the whole record as one string so the file is written with a single write()
         if self.services:
-            for service in self.services:
-                lines.append(str(service))
+            services = "\n".join(map(str, self.services))
         else:
-            lines.append("- No services registered yet")
-        
-        return "\n".join(lines)
+            services = "- No services registered yet"
+
+        return (
+            f"Name: {self.name}\n"
+            f"Client_ID: {self.client_id}\n"
+            f"Phone: {self.phone}\n"
+            f"Email: {self.email}\n"
+            f"RegistrationDate: {self.registration_date.strftime('%Y-%m-%d')}\n"
+            f"Services:\n"
+            f"{services}"
+        )
     
     @classmethod
     def from_file_content(cls, content: str) -> 'Client':
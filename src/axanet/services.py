@@ -26,9 +26,14 @@ Design Patterns Used:
 - Observer Pattern: Logging observes and records all operations
 """
 
+import csv
+import hashlib
+import json
 import logging
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import os
 
 from .models import Client
@@ -36,6 +41,19 @@ from .exceptions import ClientError, ClientNotFoundError, ClientExistsError, Fil
 from .config import get_config, get_data_directory, get_client_file_path
 
 
+# Manifest stored inside the data directory: one "normalized_name,file_path" row per client
+INDEX_FILE_NAME = "_index.csv"
+
+
+# Length of the n-grams kept in the search index; shorter queries fall back to a scan
+TRIGRAM_SIZE = 3
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of overlapping trigrams contained in ``text``."""
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
 class FileManager:
     """
     Handles file system operations for client data.
@@ -54,16 +72,19 @@ class FileManager:
         """Initialize file manager with configuration."""
         self.config = get_config()
         self.logger = logging.getLogger(__name__)
-        self._ensure_data_directory()
+        self._indexed_names: Optional[Set[str]] = None
+        # stat() results captured by the last directory scan, consumed by snapshot_signature
+        self._scan_stats: Dict[str, os.stat_result] = {}
     
     def _ensure_data_directory(self) -> None:
         """Ensure the data directory exists."""
+        # mkdir(exist_ok=True) alone is enough; no separate exists() check
+        data_dir = get_data_directory()
         try:
-            data_dir = get_data_directory()
             data_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Data directory ensured: {data_dir}")
+            self.logger.debug("Data directory ensured: %s", data_dir)
         except OSError as e:
-            raise FileOperationError("create", str(get_data_directory()), e)
+            raise FileOperationError("create", str(data_dir), e)
     
     def read_client_file(self, normalized_name: str) -> str:
         """
@@ -81,13 +102,16 @@ class FileManager:
         """
         file_path = get_client_file_path(normalized_name)
         
-        if not file_path.exists():
-            raise ClientNotFoundError(normalized_name)
-        
+        # No exists() pre-check: a missing file surfaces as FileNotFoundError,
+        # which saves one stat() per read
         try:
-            content = file_path.read_text(encoding=self.config.database.encoding)
-            self.logger.debug(f"Read client file: {file_path}")
+            with open(file_path, "r", encoding=self.config.database.encoding,
+                      buffering=self.config.database.io_buffer_size) as client_file:
+                content = client_file.read()
+            self.logger.debug("Read client file: %s", file_path)
             return content
+        except FileNotFoundError:
+            raise ClientNotFoundError(normalized_name)
         except OSError as e:
             raise FileOperationError("read", str(file_path), e)
     
@@ -101,14 +125,68 @@ class FileManager:
             
         Raises:
             FileOperationError: If file write fails
+            
+        Educational Note:
+            The content is written to a temporary file which then atomically
+            replaces the real one. An interrupted write can never leave a
+            half-written client file behind. The record is encoded once and
+            written in binary mode, skipping the TextIOWrapper layer.
+            
+            The rename alone protects against a crashed process, not against
+            a power loss. Set database.durable_writes (AXANET_DURABLE_WRITES)
+            to also fsync each file before the rename, at the cost of one
+            disk sync per create or update.
         """
         file_path = get_client_file_path(normalized_name)
+        temp_path = file_path.with_name(file_path.name + ".tmp")
+        data = content.encode(self.config.database.encoding)
         
         try:
-            file_path.write_text(content, encoding=self.config.database.encoding)
-            self.logger.debug(f"Wrote client file: {file_path}")
+            with open(temp_path, "wb", buffering=self.config.database.io_buffer_size) as client_file:
+                client_file.write(data)
+                if self.config.database.durable_writes:
+                    client_file.flush()
+                    os.fsync(client_file.fileno())
+            os.replace(temp_path, file_path)
         except OSError as e:
+            # Do not leave a half-written temporary file in the data directory
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
             raise FileOperationError("write", str(file_path), e)
+        
+        # The client file is already in place; a manifest problem must not
+        # turn a successful write into an error
+        try:
+            self._add_to_index(normalized_name)
+        except OSError as e:
+            self.logger.warning("Could not update client index: %s", e)
+        self.logger.debug("Wrote client file: %s", file_path)
+    
+    def append_client_file(self, normalized_name: str, content: str) -> None:
+        """
+        Append content to the end of an existing client file.
+        
+        Args:
+            normalized_name (str): Normalized client name
+            content (str): Content to append
+            
+        Raises:
+            FileOperationError: If file append fails
+            
+        Educational Note:
+            Appending only the new bytes is cheaper than rewriting the whole
+            record, the same idea behind append-only logs.
+        """
+        file_path = get_client_file_path(normalized_name)
+        
+        try:
+            with open(file_path, "ab", buffering=self.config.database.io_buffer_size) as client_file:
+                client_file.write(content.encode(self.config.database.encoding))
+            self.logger.debug("Appended to client file: %s", file_path)
+        except OSError as e:
+            raise FileOperationError("append", str(file_path), e)
     
     def delete_client_file(self, normalized_name: str) -> None:
         """
@@ -123,14 +201,21 @@ class FileManager:
         """
         file_path = get_client_file_path(normalized_name)
         
-        if not file_path.exists():
-            raise ClientNotFoundError(normalized_name)
-        
         try:
             file_path.unlink()
-            self.logger.debug(f"Deleted client file: {file_path}")
+        except FileNotFoundError:
+            raise ClientNotFoundError(normalized_name)
         except OSError as e:
             raise FileOperationError("delete", str(file_path), e)
+        
+        # The client file is already gone; a manifest problem must not turn
+        # a successful delete into an error
+        try:
+            self._remove_from_index(normalized_name)
+        except OSError as e:
+            self._indexed_names = None
+            self.logger.warning("Could not update client index: %s", e)
+        self.logger.debug("Deleted client file: %s", file_path)
     
     def list_client_files(self) -> List[str]:
         """
@@ -141,23 +226,257 @@ class FileManager:
             
         Raises:
             FileOperationError: If directory listing fails
+            
+        Educational Note:
+            The names are read from the CSV manifest when it is up to date,
+            so a normal startup does not enumerate the whole directory.
+            The directory is only scanned when the manifest is missing or
+            older than the directory (files added or removed externally).
         """
         try:
-            data_dir = get_data_directory()
-            file_extension = self.config.database.file_extension
+            client_files = self._read_index()
+            if client_files is None:
+                client_files = self.rebuild_index()
             
-            client_files = []
-            for file_path in data_dir.glob(f"*{file_extension}"):
-                if file_path.is_file():
+            self._indexed_names = set(client_files)
+            self.logger.debug("Listed %d client files", len(client_files))
+            return sorted(client_files)
+        
+        except OSError as e:
+            raise FileOperationError("list", str(get_data_directory()), e)
+    
+    def _scan_client_files(self) -> List[str]:
+        """Enumerate client files on disk with os.scandir."""
+        data_dir = get_data_directory()
+        file_extension = self.config.database.file_extension
+        extension_length = len(file_extension)
+        
+        # os.scandir streams directory entries and caches their type,
+        # so is_file() does not need an extra stat() per entry
+        client_files = []
+        self._scan_stats.clear()
+        # EAFP: a missing directory surfaces here instead of being stat()ed
+        # up front at startup; create it and report no clients
+        try:
+            entries = os.scandir(data_dir)
+        except FileNotFoundError:
+            self._ensure_data_directory()
+            return client_files
+        
+        with entries:
+            for entry in entries:
+                if (entry.name.endswith(file_extension) and entry.name != INDEX_FILE_NAME
+                        and entry.is_file(follow_symlinks=False)):
                     # Remove extension to get normalized name
-                    normalized_name = file_path.stem
+                    normalized_name = entry.name[:-extension_length]
                     client_files.append(normalized_name)
+                    # DirEntry caches its stat (free on Windows, one call on
+                    # POSIX); keep it so snapshot_signature does not stat again
+                    self._scan_stats[normalized_name] = entry.stat(follow_symlinks=False)
+        
+        return client_files
+    
+    def _read_index(self) -> Optional[List[str]]:
+        """
+        Read client names from the CSV manifest.
+        
+        Returns:
+            Optional[List[str]]: Names in the manifest, or None if it is missing or stale
+        """
+        index_path = get_data_directory() / INDEX_FILE_NAME
+        try:
+            index_mtime = index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        # Equal timestamps are treated as stale too: with a coarse clock a
+        # file added right after the manifest was written shares its mtime
+        if index_mtime <= get_data_directory().stat().st_mtime_ns:
+            return None
+        
+        with open(index_path, newline="", encoding="utf-8") as index_file:
+            return [row[0] for row in csv.reader(index_file) if row]
+    
+    def rebuild_index(self) -> List[str]:
+        """
+        Rebuild the CSV manifest from the files on disk.
+        
+        Returns:
+            List[str]: Normalized names found in the data directory
+        """
+        client_files = self._scan_client_files()
+        # The manifest is only a shortcut: if it cannot be written, the
+        # scan result is still correct and the next run scans again
+        try:
+            self._write_index(client_files)
+        except OSError as e:
+            self.logger.warning("Could not write client index: %s", e)
+            return client_files
+        self.logger.debug("Rebuilt client index with %d entries", len(client_files))
+        return client_files
+    
+    def _write_index(self, client_names) -> None:
+        """Rewrite the CSV manifest with the given client names."""
+        data_dir = get_data_directory()
+        index_path = data_dir / INDEX_FILE_NAME
+        
+        # Resolve the directory once and build each path by concatenation,
+        # instead of a get_client_file_path() call (resolve + join) per row
+        prefix = str(data_dir) + os.sep
+        file_extension = self.config.database.file_extension
+        with open(index_path, "w", newline="", encoding="utf-8") as index_file:
+            writer = csv.writer(index_file)
+            writer.writerows((name, prefix + name + file_extension) for name in client_names)
+    
+    def _add_to_index(self, normalized_name: str) -> None:
+        """Append a single new client to the CSV manifest."""
+        if self._indexed_names is None:
+            return
+        
+        index_path = get_data_directory() / INDEX_FILE_NAME
+        try:
+            if normalized_name in self._indexed_names:
+                # Replacing an existing file touches the directory mtime;
+                # touch the manifest too so it is not considered stale
+                os.utime(index_path)
+                return
             
-            self.logger.debug(f"Listed {len(client_files)} client files")
-            return sorted(client_files)
+            # "r+" rather than "a": a missing manifest must not be recreated
+            # holding only this one row
+            with open(index_path, "r+", newline="", encoding="utf-8") as index_file:
+                index_file.seek(0, os.SEEK_END)
+                csv.writer(index_file).writerow((normalized_name, str(get_client_file_path(normalized_name))))
+        except FileNotFoundError:
+            # The manifest was removed; the next listing rebuilds it from disk
+            self._indexed_names = None
+            return
+        self._indexed_names.add(normalized_name)
+    
+    def _remove_from_index(self, normalized_name: str) -> None:
+        """Drop a deleted client from the CSV manifest."""
+        if self._indexed_names is None or normalized_name not in self._indexed_names:
+            return
         
+        self._indexed_names.discard(normalized_name)
+        self._write_index(sorted(self._indexed_names))
+    
+    def snapshot_signature(self, client_files: List[str]) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Describe the listed client files for snapshot validation.
+        
+        Args:
+            client_files (List[str]): Names returned by list_client_files()
+            
+        Returns:
+            Tuple[Tuple[str, int, int], ...]: Sorted (name, mtime_ns, size) per client file
+            
+        Educational Note:
+            The signature covers exactly the names that were listed, so the
+            two can never disagree. When the manifest was stale, the stats
+            come from the directory scan that rebuilt it; otherwise each
+            file is stat()ed once, without enumerating the directory.
+        """
+        stats = self._scan_stats
+        signature = []
+        for name in client_files:
+            stat_result = stats.get(name)
+            if stat_result is None:
+                try:
+                    stat_result = os.stat(get_client_file_path(name))
+                except FileNotFoundError:
+                    continue
+            signature.append((name, stat_result.st_mtime_ns, stat_result.st_size))
+        # Single use: later calls must not see stats that may have gone stale
+        stats.clear()
+        return tuple(sorted(signature))
+    
+    def _snapshot_path(self) -> Optional[Path]:
+        """Return the snapshot file for this data directory, or None if disabled."""
+        cache_directory = self.config.database.cache_directory
+        if not cache_directory:
+            return None
+        # One snapshot per data directory, so several data sets never collide
+        digest = hashlib.sha1(str(get_data_directory()).encode("utf-8")).hexdigest()[:16]
+        return Path(cache_directory).expanduser() / f"clients-{digest}.json"
+    
+    def load_snapshot(self, signature: Tuple[Tuple[str, int, int], ...]) -> Optional[Dict[str, Client]]:
+        """
+        Load the clients saved by an earlier run.
+        
+        Educational Note:
+            The snapshot is plain JSON built from Client.to_dict(), so loading
+            it only parses data; unlike pickle, a tampered file outside the
+            data directory cannot run code.
+        
+        Args:
+            signature: Current snapshot_signature() of the data directory
+            
+        Returns:
+            Optional[Dict[str, Client]]: Clients by normalized name, or None if
+            there is no snapshot or it does not match the files on disk
+        """
+        snapshot_path = self._snapshot_path()
+        if snapshot_path is None:
+            return None
+        
+        try:
+            with open(snapshot_path, encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            saved_signature = tuple(tuple(entry) for entry in snapshot["signature"])
+            if saved_signature != signature:
+                return None
+            clients = {
+                normalized_name: Client.from_dict(data)
+                for normalized_name, data in snapshot["clients"].items()
+            }
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A truncated or incompatible snapshot is only a cache miss
+            self.logger.debug("Ignoring unreadable client snapshot %s: %s", snapshot_path, e)
+            return None
+        
+        self.logger.debug("Loaded %d clients from snapshot %s", len(clients), snapshot_path)
+        return clients
+    
+    def save_snapshot(self, signature: Tuple[Tuple[str, int, int], ...], clients: Dict[str, Client]) -> None:
+        """
+        Save the loaded clients as JSON for the next run.
+        
+        Args:
+            signature: snapshot_signature() taken before the clients were read
+            clients: Clients by normalized name
+        """
+        snapshot_path = self._snapshot_path()
+        if snapshot_path is None:
+            return
+        
+        temp_path = snapshot_path.with_suffix(".tmp")
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            snapshot = {
+                "signature": signature,
+                "clients": {normalized_name: client.to_dict() for normalized_name, client in clients.items()},
+            }
+            with open(temp_path, "w", encoding="utf-8") as snapshot_file:
+                json.dump(snapshot, snapshot_file, separators=(",", ":"))
+            os.replace(temp_path, snapshot_path)
         except OSError as e:
-            raise FileOperationError("list", str(get_data_directory()), e)
+            # The snapshot is an optimization; failing to write it is not an error
+            self.logger.debug("Could not write client snapshot %s: %s", snapshot_path, e)
+    
+    def discard_snapshot(self) -> None:
+        """Delete the snapshot after the client files change."""
+        snapshot_path = self._snapshot_path()
+        if snapshot_path is None:
+            return
+        
+        try:
+            os.unlink(snapshot_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning("Could not remove stale client snapshot %s: %s", snapshot_path, e)
     
     def file_exists(self, normalized_name: str) -> bool:
         """
@@ -190,19 +509,30 @@ class ClientManager:
     
     Attributes:
         _clients_cache (Dict[str, Client]): In-memory cache of loaded clients
+        _search_slots (Dict[str, int]): Position of each client in the search columns
+        _search_keys, _names_lc, _emails_lc, _phones (List[str]): Parallel search
+            columns (normalized key, lowercased name, lowercased email, phone)
+        _trigram_index (Dict[str, Set[str]]): Inverted index from each trigram of
+            the search columns to the normalized names that contain it
         _file_manager (FileManager): Handles file system operations
     """
     
     def __init__(self):
         """Initialize client manager."""
         self._clients_cache: Dict[str, Client] = {}
+        self._search_slots: Dict[str, int] = {}
+        self._search_keys: List[str] = []
+        self._names_lc: List[str] = []
+        self._emails_lc: List[str] = []
+        self._phones: List[str] = []
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
         self._file_manager = FileManager()
         self.logger = logging.getLogger(__name__)
         
         # Load existing clients into cache
         self._load_all_clients()
         
-        self.logger.info(f"ClientManager initialized with {len(self._clients_cache)} clients")
+        self.logger.info("ClientManager initialized with %d clients", len(self._clients_cache))
     
     def _load_all_clients(self) -> None:
         """
@@ -212,20 +542,104 @@ class ClientManager:
             Loading all clients at startup provides fast access but uses more memory.
             This is suitable for small to medium datasets. For larger datasets,
             you might implement lazy loading or pagination.
+            
+            Each CLI command runs in a fresh process, so the parsed clients
+            are also saved to a JSON snapshot. When no client file changed since
+            then (same names, mtimes and sizes), the next run loads that one
+            file instead of opening and parsing every client file.
         """
         try:
             client_files = self._file_manager.list_client_files()
+            signature = self._file_manager.snapshot_signature(client_files)
             
+            snapshot = self._file_manager.load_snapshot(signature)
+            if snapshot is not None:
+                for normalized_name, client in snapshot.items():
+                    self._add_to_cache(normalized_name, client)
+                return
+            
+            loaded: Dict[str, Client] = {}
             for normalized_name in client_files:
                 try:
                     content = self._file_manager.read_client_file(normalized_name)
                     client = Client.from_file_content(content)
-                    self._clients_cache[normalized_name] = client
+                    self._add_to_cache(normalized_name, client)
+                    loaded[normalized_name] = client
                 except Exception as e:
-                    self.logger.warning(f"Failed to load client {normalized_name}: {e}")
+                    self.logger.warning("Failed to load client %s: %s", normalized_name, e)
+            
+            self._file_manager.save_snapshot(signature, loaded)
                     
         except Exception as e:
-            self.logger.error(f"Failed to load clients: {e}")
+            self.logger.error("Failed to load clients: %s", e)
+    
+    def _add_to_cache(self, normalized_name: str, client: Client) -> None:
+        """
+        Store a client in the cache together with its search keys.
+        
+        Educational Note:
+            Lowercasing is done here, once per client, instead of on every
+            search. The search keys live in parallel lists (a "structure of
+            arrays"), so the search loop walks flat lists of strings instead
+            of chasing attributes on every Client object.
+        """
+        self._clients_cache[normalized_name] = client
+        slot = self._search_slots.get(normalized_name)
+        if slot is None:
+            self._search_slots[normalized_name] = len(self._search_keys)
+            self._search_keys.append(normalized_name)
+            self._names_lc.append(client.name.lower())
+            self._emails_lc.append(client.email.lower())
+            self._phones.append(client.phone)
+        else:
+            self._unindex_trigrams(normalized_name, slot)
+            self._names_lc[slot] = client.name.lower()
+            self._emails_lc[slot] = client.email.lower()
+            self._phones[slot] = client.phone
+        self._index_trigrams(normalized_name, self._search_slots[normalized_name])
+    
+    def _slot_trigrams(self, slot: int) -> Set[str]:
+        """Return the trigrams of every search column in one row."""
+        return (_trigrams(self._names_lc[slot])
+                | _trigrams(self._emails_lc[slot])
+                | _trigrams(self._phones[slot]))
+    
+    def _index_trigrams(self, normalized_name: str, slot: int) -> None:
+        """Add one row of the search columns to the trigram index."""
+        index = self._trigram_index
+        for trigram in self._slot_trigrams(slot):
+            index[trigram].add(normalized_name)
+    
+    def _unindex_trigrams(self, normalized_name: str, slot: int) -> None:
+        """Remove one row of the search columns from the trigram index."""
+        index = self._trigram_index
+        for trigram in self._slot_trigrams(slot):
+            postings = index.get(trigram)
+            if postings is not None:
+                postings.discard(normalized_name)
+                if not postings:
+                    del index[trigram]
+    
+    def _remove_from_search_columns(self, normalized_name: str) -> None:
+        """
+        Remove a client from the search columns.
+        
+        Educational Note:
+            The last row is moved into the freed slot ("swap and pop"), so
+            removal is O(1) instead of shifting every row after it.
+        """
+        self._unindex_trigrams(normalized_name, self._search_slots[normalized_name])
+        slot = self._search_slots.pop(normalized_name)
+        last_key = self._search_keys.pop()
+        last_name = self._names_lc.pop()
+        last_email = self._emails_lc.pop()
+        last_phone = self._phones.pop()
+        if last_key != normalized_name:
+            self._search_keys[slot] = last_key
+            self._names_lc[slot] = last_name
+            self._emails_lc[slot] = last_email
+            self._phones[slot] = last_phone
+            self._search_slots[last_key] = slot
     
     def create_client(self, name: str, phone: str, email: str, first_service: str) -> Client:
         """
@@ -268,11 +682,12 @@ class ClientManager:
         # Save to file
         content = client.to_file_format()
         self._file_manager.write_client_file(normalized_name, content)
+        self._file_manager.discard_snapshot()
         
         # Add to cache
-        self._clients_cache[normalized_name] = client
+        self._add_to_cache(normalized_name, client)
         
-        self.logger.info(f"Created client: {name} ({client.client_id})")
+        self.logger.info("Created client: %s (%s)", name, client.client_id)
         return client
     
     def get_client(self, name: str) -> Client:
@@ -289,13 +704,13 @@ class ClientManager:
             ClientNotFoundError: If client doesn't exist
         """
         # Normalize the name for lookup
-        normalized_name = Client(name=name, phone="", email="").normalized_name
+        normalized_name = Client.normalize_name(name)
         
         if normalized_name not in self._clients_cache:
             raise ClientNotFoundError(name)
         
         client = self._clients_cache[normalized_name]
-        self.logger.debug(f"Retrieved client: {name}")
+        self.logger.debug("Retrieved client: %s", name)
         return client
     
     def get_all_clients(self) -> List[Client]:
@@ -310,11 +725,27 @@ class ClientManager:
             of the internal cache. This is a defensive programming practice.
         """
         clients = list(self._clients_cache.values())
-        clients.sort(key=lambda c: c.name)  # Sort by name for consistent ordering
+        clients.sort(key=attrgetter("name"))  # Sort by name for consistent ordering
         
-        self.logger.debug(f"Retrieved {len(clients)} clients")
+        self.logger.debug("Retrieved %d clients", len(clients))
         return clients
     
+    def iter_clients(self) -> Iterator[Client]:
+        """
+        Yield all clients one at a time, sorted by name.
+        
+        Yields:
+            Client: Next client in name order
+            
+        Educational Note:
+            Unlike get_all_clients(), the caller does not receive a list:
+            each client is handed over as it is reached, so rendering can
+            start right away. attrgetter reads the sort key in C instead of
+            a lambda doing a dict lookup per client.
+        """
+        for client in sorted(self._clients_cache.values(), key=attrgetter("name")):
+            yield client
+    
     def update_client(self, name: str, new_service: str) -> Client:
         """
         Add a new service to an existing client.
@@ -333,24 +764,32 @@ class ClientManager:
         """
         # Get client from cache
         client = self.get_client(name)
+        had_services = bool(client.services)
         
         # Add new service (this validates the service description)
         client.add_service(new_service)
         
-        # Save updated client to file
+        # Save updated client to file. The services section is the last part
+        # of the file, so the new line can simply be appended; a rewrite is
+        # only needed to replace the "no services" placeholder.
         normalized_name = client.normalized_name
-        content = client.to_file_format()
-        self._file_manager.write_client_file(normalized_name, content)
-        
-        self.logger.info(f"Updated client {name} with new service: {new_service}")
+        if had_services:
+            self._file_manager.append_client_file(normalized_name, f"\n{client.services[-1]}")
+        else:
+            content = client.to_file_format()
+            self._file_manager.write_client_file(normalized_name, content)
+        self._file_manager.discard_snapshot()
+        
+        self.logger.info("Updated client %s with new service: %s", name, new_service)
         return client
     
-    def delete_client(self, name: str) -> bool:
+    def delete_client(self, name: str, client: Optional[Client] = None) -> bool:
         """
         Delete a client.
         
         Args:
             name (str): Client name
+            client (Optional[Client]): The client, if the caller already looked it up
             
         Returns:
             bool: True if client was deleted
@@ -359,17 +798,24 @@ class ClientManager:
             ClientNotFoundError: If client doesn't exist
             FileOperationError: If file operations fail
         """
-        # Get client to ensure it exists
-        client = self.get_client(name)
+        # Get client to ensure it exists (skipped when the caller passes it)
+        if client is None:
+            client = self.get_client(name)
         normalized_name = client.normalized_name
         
-        # Delete file
-        self._file_manager.delete_client_file(normalized_name)
+        # Delete file; the cache is the source of truth, so a file that was
+        # already removed outside the application only leaves a stale entry
+        try:
+            self._file_manager.delete_client_file(normalized_name)
+        except ClientNotFoundError:
+            self.logger.warning("Client file for %s was already missing", normalized_name)
+        self._file_manager.discard_snapshot()
         
         # Remove from cache
         del self._clients_cache[normalized_name]
+        self._remove_from_search_columns(normalized_name)
         
-        self.logger.info(f"Deleted client: {name} ({client.client_id})")
+        self.logger.info("Deleted client: %s (%s)", name, client.client_id)
         return True
     
     def client_exists(self, name: str) -> bool:
@@ -382,7 +828,7 @@ class ClientManager:
         Returns:
             bool: True if client exists
         """
-        normalized_name = Client(name=name, phone="", email="").normalized_name
+        normalized_name = Client.normalize_name(name)
         return normalized_name in self._clients_cache
     
     def get_client_count(self) -> int:
@@ -405,24 +851,42 @@ class ClientManager:
             List[Client]: Matching clients
             
         Educational Note:
-            This demonstrates basic search functionality. In a production
-            system, you might implement more sophisticated search with
-            indexing, fuzzy matching, or full-text search capabilities.
+            Queries of three or more characters go through a trigram
+            inverted index: every substring match must contain all of the
+            query's trigrams, so intersecting their posting sets yields a
+            small candidate list, and only those candidates get the real
+            substring check. Shorter queries have no trigrams and fall back
+            to a single pass over the search columns.
         """
         query = query.lower().strip()
         matching_clients = []
-        
-        for client in self._clients_cache.values():
-            # Search in name, email, and phone
-            if (query in client.name.lower() or 
-                query in client.email.lower() or 
-                query in client.phone):
-                matching_clients.append(client)
+        cache = self._clients_cache
+        
+        query_trigrams = _trigrams(query)
+        if query_trigrams:
+            # Intersect from the smallest posting set so the work stays small
+            postings = sorted(
+                (self._trigram_index.get(trigram, set()) for trigram in query_trigrams),
+                key=len,
+            )
+            candidates = postings[0].intersection(*postings[1:])
+            slots = self._search_slots
+            for normalized_name in candidates:
+                slot = slots[normalized_name]
+                if (query in self._names_lc[slot] or query in self._emails_lc[slot]
+                        or query in self._phones[slot]):
+                    matching_clients.append(cache[normalized_name])
+        else:
+            # Search in name, email, and phone with a single pass over the columns
+            for normalized_name, name_lower, email_lower, phone in zip(
+                    self._search_keys, self._names_lc, self._emails_lc, self._phones):
+                if query in name_lower or query in email_lower or query in phone:
+                    matching_clients.append(cache[normalized_name])
         
         # Sort by name for consistent results
-        matching_clients.sort(key=lambda c: c.name)
+        matching_clients.sort(key=attrgetter("name"))
         
-        self.logger.debug(f"Search for '{query}' found {len(matching_clients)} clients")
+        self.logger.debug("Search for '%s' found %d clients", query, len(matching_clients))
         return matching_clients
     
     def refresh_cache(self) -> None:
@@ -434,8 +898,14 @@ class ClientManager:
             might modify the data files, or for debugging cache-related issues.
         """
         self._clients_cache.clear()
+        self._search_slots.clear()
+        self._search_keys.clear()
+        self._names_lc.clear()
+        self._emails_lc.clear()
+        self._phones.clear()
+        self._trigram_index.clear()
         self._load_all_clients()
-        self.logger.info(f"Cache refreshed with {len(self._clients_cache)} clients")
+        self.logger.info("Cache refreshed with %d clients", len(self._clients_cache))
     
     def get_statistics(self) -> Dict[str, int | float]:
         """
@@ -40,7 +40,8 @@ def setup_logging(
     log_level: str = "INFO",
     max_file_size_mb: int = 10,
     backup_count: int = 5,
-    console_output: bool = True
+    console_output: bool = True,
+    buffer_records: int = 0
 ) -> None:
     """
     Configure application logging with file rotation and console output.
@@ -51,6 +52,8 @@ def setup_logging(
         max_file_size_mb (int): Maximum size of log file in MB before rotation
         backup_count (int): Number of backup log files to keep
         console_output (bool): Whether to output logs to console
+        buffer_records (int): Batch this many records in memory before writing
+            them to the log file (0 writes every record immediately)
         
     Educational Note:
         Proper logging setup is crucial for production applications.
@@ -59,6 +62,7 @@ def setup_logging(
         - Log rotation to prevent disk space issues
         - Configurable log levels for different environments
         - Formatted output for better readability
+        - Optional in-memory batching so the file is not flushed per record
     """
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -98,7 +102,20 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        if buffer_records > 0:
+            # StreamHandler flushes after every record; MemoryHandler collects
+            # records and hands them over in batches (immediately on ERROR,
+            # and at interpreter exit via logging.shutdown)
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=buffer_records,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            buffered_handler.setLevel(numeric_level)
+            root_logger.addHandler(buffered_handler)
+        else:
+            root_logger.addHandler(file_handler)
 
 
 def validate_email(email: str) -> bool: